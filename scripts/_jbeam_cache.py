@@ -0,0 +1,25 @@
+"""Shared (path, mtime)-keyed jbeam parse cache for the test scripts.
+
+Only for scripts that read parsed data: production callers in engineswap.py
+modify what parse_jbeam returns, so the parser itself stays uncached.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+
+@lru_cache(maxsize=64)
+def cached_parse(path_str: str, mtime_ns: Optional[int]):
+    """Parse a jbeam file once per (path, mtime); callers must not mutate the result."""
+    # Deferred so importing this module doesn't pull in engineswap
+    from engineswap import JBeamParser
+    return JBeamParser.parse_jbeam(Path(path_str))
+
+
+def file_mtime_ns(path: Path) -> Optional[int]:
+    """Single stat for existence and cache key; None when the file is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
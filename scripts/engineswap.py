@@ -761,6 +761,18 @@ class JBeamParser:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
+            # Fast path: files we wrote ourselves (and many mod files) are
+            # already strict JSON, so skip the regex preprocessing entirely.
+            # Vanilla files carry // and /* */ comments and would only fail
+            # partway through, so don't attempt a strict parse on those.
+            if '//' not in content and '/*' not in content:
+                try:
+                    data = json.loads(content)
+                    logger.debug(f"Successfully parsed {file_path.name} (strict JSON)")
+                    return data
+                except json.JSONDecodeError:
+                    pass
+            
             # Clean up content
             content = cls.strip_comments(content)
             content = cls.add_missing_commas(content)
@@ -19,11 +19,16 @@ Module Responsibilities:
 """
 
 import math
+import os
 import re
+import sys
+import types
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Set
 from dataclasses import dataclass, field
+from enum import IntFlag
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +80,14 @@ except ImportError:
 EXHAUST_SLOT_PATTERNS = re.compile(
     r'(header|exhmanifold|exhaust|downpipe)', re.IGNORECASE
 )
+_EXHAUST_SEARCH = EXHAUST_SLOT_PATTERNS.search
+
+# Intermediate exhaust stages (as opposed to the final exhaust slot), matched
+# in one case-insensitive pass instead of several lower()/substring checks
+_DOWNSTREAM_STAGE_SEARCH = re.compile(r'header|manifold|downpipe', re.IGNORECASE).search
+
+# Intake/turbo stages anywhere along a chain mark it as Pattern B
+_INTAKE_STAGE_SEARCH = re.compile(r'intake|turbo', re.IGNORECASE).search
 
 # Exhaust manifold bridge node pattern (exm1r, exm1l, exm2r, etc.)
 _BRIDGE_NODE_PATTERN = re.compile(r'^exm\d+[rl]?$', re.IGNORECASE)
@@ -84,6 +97,13 @@ SLOTS_HEADER_KEYS = frozenset({
     'type', 'name', 'default', 'allowTypes', 'denyTypes', 'description'
 })
 
+# First-column values that mark a nodes/beams header row
+_NODE_HEADER_IDS = frozenset({'id', 'id1', 'id2'})
+
+# Sentinel exhaust_slot_type for a chain that never reached an exhaust slot.
+# Interned so the != checks against it hit CPython's identity fast path.
+_NONE_FOUND = sys.intern("(none found)")
+
 # File stem substrings to exclude from engine file discovery
 ENGINE_FILE_EXCLUDES = frozenset({
     'enginemounts', 'management', 'engineaccessories'
@@ -93,7 +113,7 @@ ENGINE_FILE_EXCLUDES = frozenset({
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IsExhaustNode:
     """An engine node carrying the isExhaust property."""
     name: str
@@ -103,20 +123,47 @@ class IsExhaustNode:
     group: str           # active nodeGroup at this node's position
     source_part: str
     source_file: str
+    pos: Tuple[float, float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # (x, y, z) packed once for the distance pairing
+        object.__setattr__(self, 'pos', (self.x, self.y, self.z))
 
 
-@dataclass
+class ChainKind(IntFlag):
+    """Structural flags for a traced exhaust chain (see classify_pattern)."""
+    NONE = 0
+    SIBLING = 1      # exhaust slot sits directly on the engine (Pattern A')
+    VIA_INTAKE = 2   # chain passes through an intake/turbo stage (Pattern B)
+
+    @classmethod
+    def from_chain_path(cls, chain_path: str) -> 'ChainKind':
+        """Flags implied by a chain's human-readable path."""
+        kind = cls.NONE
+        if 'sibling' in chain_path.lower():
+            kind |= cls.SIBLING
+        if _INTAKE_STAGE_SEARCH(chain_path):
+            kind |= cls.VIA_INTAKE
+        return kind
+
+
+@dataclass(slots=True, frozen=True)
 class ExhaustSlotInfo:
     """Result of tracing one exhaust slot chain from an engine."""
     downstream_component_name: str       # e.g. "pickup_header_v8"
     downstream_component_slotType: str   # slotType of that component
     exhaust_slot_type: str               # e.g. "pickup_exhaust_v8" or "(none found)"
     chain_path: str                      # human-readable chain description
-    node_names: List[str] = field(default_factory=list)
-    node_positions: List[Tuple[float, float, float]] = field(default_factory=list)
+    node_names: Tuple[str, ...] = ()
+    node_positions: Tuple[Tuple[float, float, float], ...] = ()
+    kind: ChainKind = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived once from chain_path so classify_pattern reads a flag
+        object.__setattr__(self, 'kind', ChainKind.from_chain_path(self.chain_path))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EngineExhaustProfile:
     """Complete exhaust profile for one target engine."""
     engine_file: str
@@ -128,7 +175,7 @@ class EngineExhaustProfile:
     notes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExhaustSolverResult:
     """Result returned to engineswap.py for integration."""
     strategy: str                                # "matching", "mismatch", "no_exhaust"
@@ -184,6 +231,29 @@ def _extract_slot_fields(slot_entry: list) -> Tuple[str, str, str]:
     return slot_type, default, desc
 
 
+def _intern_slot_types(parsed_data: Dict[str, Any]) -> None:
+    """Intern each part's slotType and child slot names in place.
+
+    The same few slotType strings are compared and hashed over and over
+    while tracing chains across a merged vehicle; interning makes those
+    compares identity hits instead of character scans.
+    """
+    intern = sys.intern
+    for part_data in parsed_data.values():
+        if type(part_data) is not dict:
+            continue
+        st = part_data.get('slotType')
+        if type(st) is str:
+            part_data['slotType'] = intern(st)
+        for key in ('slots', 'slots2'):
+            rows = part_data.get(key)
+            if type(rows) is not list:
+                continue
+            for row in rows:
+                if type(row) is list and row and type(row[0]) is str:
+                    row[0] = intern(row[0])
+
+
 # =========================================================================
 # Node Extraction
 # =========================================================================
@@ -212,44 +282,46 @@ def extract_isExhaust_nodes(
 
         is_exhaust_nodes: List[IsExhaustNode] = []
         current_group = ""
+        source_file_str = str(source_file)
 
+        # Parsed jbeam only yields plain dicts/lists, so exact type() checks
+        # are safe here and cheaper than isinstance() on this hot path.
         for item in nodes_section:
+            t = type(item)
+
             # Property modifier row — track group state
-            if isinstance(item, dict):
+            if t is dict:
                 for group_key in ('group', 'nodeGroup'):
                     if group_key in item:
                         g = item[group_key]
-                        if isinstance(g, list):
+                        if type(g) is list:
                             current_group = ', '.join(str(x) for x in g)
-                        elif isinstance(g, str):
+                        elif type(g) is str:
                             current_group = g
                         else:
                             current_group = str(g) if g else ""
                 continue
 
-            if not isinstance(item, list) or len(item) < 4:
-                continue
-
-            # Skip header rows
-            if isinstance(item[0], str) and item[0] in ('id', 'id1', 'id2'):
+            if t is not list or len(item) < 4:
                 continue
 
-            # Check for isExhaust in inline properties dict
-            has_is_exhaust = False
-            for idx in (4, 3):  # check item[4] first, then item[3]
-                if len(item) > idx and isinstance(item[idx], dict):
-                    if 'isExhaust' in item[idx]:
-                        has_is_exhaust = True
-                        break
+            # Check for isExhaust in inline properties dict (item[4], then item[3])
+            props = item[4] if len(item) > 4 else None
+            if type(props) is not dict or 'isExhaust' not in props:
+                props = item[3]
+                if type(props) is not dict or 'isExhaust' not in props:
+                    continue
 
-            if not has_is_exhaust:
+            # Skip header rows
+            first = item[0]
+            if type(first) is str and first in _NODE_HEADER_IDS:
                 continue
 
-            node_name = str(item[0]).rstrip(',').strip('"')
+            node_name = str(first).rstrip(',').strip('"')
             try:
                 x = float(item[1])
                 y = float(item[2])
-                z = float(item[3]) if not isinstance(item[3], dict) else 0.0
+                z = float(item[3]) if type(item[3]) is not dict else 0.0
             except (TypeError, ValueError):
                 continue
 
@@ -258,7 +330,7 @@ def extract_isExhaust_nodes(
                 x=x, y=y, z=z,
                 group=current_group,
                 source_part=part_name,
-                source_file=str(source_file)
+                source_file=source_file_str
             ))
 
         if is_exhaust_nodes:
@@ -282,16 +354,17 @@ def _extract_part_nodes(
 
     nodes = []
     for item in nodes_section:
-        if not isinstance(item, list) or len(item) < 4:
+        if type(item) is not list or len(item) < 4:
             continue
-        if isinstance(item[0], str) and item[0] in ('id', 'id1', 'id2'):
+        first = item[0]
+        if type(first) is str and first in _NODE_HEADER_IDS:
             continue
         try:
             nodes.append({
-                'name': str(item[0]).rstrip(',').strip('"'),
+                'name': str(first).rstrip(',').strip('"'),
                 'x': float(item[1]),
                 'y': float(item[2]),
-                'z': float(item[3]) if not isinstance(item[3], dict) else 0.0,
+                'z': float(item[3]) if type(item[3]) is not dict else 0.0,
             })
         except (TypeError, ValueError):
             continue
@@ -299,6 +372,31 @@ def _extract_part_nodes(
     return nodes
 
 
+# part name → (node names, node positions), scoped to one merged dataset
+_PartNodeCache = Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[float, float, float], ...]]]
+
+
+def _part_node_tuples(
+    parsed_data: Dict[str, Any],
+    part_name: str,
+    node_cache: _PartNodeCache,
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[float, float, float], ...]]:
+    """Node names and positions of a part as immutable tuples.
+
+    The same headers/manifolds are reached from every engine of a vehicle,
+    so results are memoized in node_cache, which the caller scopes to one
+    profiling pass over parsed_data.
+    """
+    entry = node_cache.get(part_name)
+    if entry is None:
+        nodes = _extract_part_nodes(parsed_data, part_name)
+        entry = node_cache[part_name] = (
+            tuple(n['name'] for n in nodes),
+            tuple((n['x'], n['y'], n['z']) for n in nodes),
+        )
+    return entry
+
+
 def count_donor_isExhaust_nodes(
     adapted_engine_path: Path,
 ) -> Tuple[int, List[IsExhaustNode]]:
@@ -339,6 +437,30 @@ def count_donor_isExhaust_nodes(
 # File Discovery
 # =========================================================================
 
+def _scan_jbeam_files(search_dir: Path, *keywords: str) -> List[Path]:
+    """List *.jbeam files in search_dir whose stem contains a keyword.
+
+    Equivalent to one ``glob("*<kw>*.jbeam")`` per keyword, concatenated in
+    keyword order, but reads the directory once via os.scandir. Names are
+    compared through os.path.normcase so matching stays case-insensitive on
+    Windows, like glob. Returns [] if search_dir does not exist.
+    """
+    stems: List[Tuple[str, str]] = []
+    try:
+        with os.scandir(search_dir) as it:
+            for e in it:
+                name = os.path.normcase(e.name)
+                if name.endswith('.jbeam') and e.is_file():
+                    stems.append((name[:-6], e.path))
+    except OSError:
+        return []
+
+    return [
+        Path(path) for kw in keywords
+        for stem, path in stems if kw in stem
+    ]
+
+
 def find_engine_files(base_path: Path, vehicle_name: str,
                       family_prefix: Optional[str] = None) -> List[Path]:
     """Find all engine jbeam files for a target vehicle.
@@ -360,9 +482,7 @@ def find_engine_files(base_path: Path, vehicle_name: str,
         )
 
     for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
-        for f in search_dir.glob("*engine*.jbeam"):
+        for f in _scan_jbeam_files(search_dir, 'engine'):
             stem_lower = f.stem.lower()
             if any(excl in stem_lower for excl in ENGINE_FILE_EXCLUDES):
                 continue
@@ -390,10 +510,7 @@ def find_exhaust_files(base_path: Path, vehicle_name: str,
         )
 
     for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
-        for f in search_dir.glob("*exhaust*.jbeam"):
-            exhaust_files.append(f)
+        exhaust_files.extend(_scan_jbeam_files(search_dir, 'exhaust'))
 
     return exhaust_files
 
@@ -417,11 +534,9 @@ def find_body_frame_files(base_path: Path, vehicle_name: str,
         )
 
     for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
-        for pattern in ("*body*.jbeam", "*frame*.jbeam", "*chassis*.jbeam"):
-            for f in search_dir.glob(pattern):
-                body_files.append(f)
+        body_files.extend(
+            _scan_jbeam_files(search_dir, 'body', 'frame', 'chassis')
+        )
 
     return body_files
 
@@ -430,12 +545,35 @@ def find_body_frame_files(base_path: Path, vehicle_name: str,
 # Cross-File Merged Data
 # =========================================================================
 
+# Files are read and parsed on a small thread pool; parse_jbeam is
+# stateless, and overlapping the reads hides most of the disk latency.
+_PARSE_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def _parse_one_jbeam(f: Path) -> Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]:
+    try:
+        return f, JBeamParser.parse_jbeam(f), None
+    except Exception as e:
+        return f, None, e
+
+
+def _parse_jbeam_files(
+    files: List[Path],
+) -> List[Tuple[Path, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """Parse files concurrently; returns (path, parsed, error) in input order."""
+    if len(files) < 2:
+        return [_parse_one_jbeam(f) for f in files]
+    with ThreadPoolExecutor(max_workers=min(_PARSE_WORKERS, len(files))) as ex:
+        return list(ex.map(_parse_one_jbeam, files))
+
+
 def build_merged_vehicle_data(
     base_path: Path,
     vehicle_name: str,
     engine_files: Optional[List[Path]] = None,
     exhaust_files: Optional[List[Path]] = None,
     family_prefix: Optional[str] = None,
+    parsed_files: Optional[Dict[Path, Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """Build merged parsed data from all engine + exhaust + body/frame files.
 
@@ -448,6 +586,10 @@ def build_merged_vehicle_data(
 
     For family-shared architectures (e.g. etk800 uses etk_engine), pass
     family_prefix='etk' so discovery also searches common/etk/.
+
+    If parsed_files is given, each file's parsed dict is also recorded
+    there (keyed by the path as passed in) so callers can reuse per-file
+    results without parsing the file a second time.
     """
     if _get_parser() is None:
         logger.error("JBeamParser not available")
@@ -460,22 +602,28 @@ def build_merged_vehicle_data(
 
     body_files = find_body_frame_files(base_path, vehicle_name, family_prefix)
 
-    merged: Dict[str, Any] = {}
+    # De-duplicate up front (first occurrence wins) so parsing can be
+    # batched; merge order below still follows engine → exhaust → body.
+    unique_files: List[Path] = []
     seen_files: Set[Path] = set()
-
     for flist in [engine_files, exhaust_files, body_files]:
         for f in flist:
             abs_f = f.resolve()
             if abs_f in seen_files:
                 continue
             seen_files.add(abs_f)
-            try:
-                parsed = JBeamParser.parse_jbeam(f)
-                if parsed:
-                    merged.update(parsed)
-            except Exception as e:
-                logger.debug(f"Skipping unparseable file {f.name}: {e}")
-                continue
+            unique_files.append(f)
+
+    merged: Dict[str, Any] = {}
+    for f, parsed, err in _parse_jbeam_files(unique_files):
+        if err is not None:
+            logger.debug(f"Skipping unparseable file {f.name}: {err}")
+            continue
+        if parsed_files is not None:
+            parsed_files[f] = parsed
+        if parsed:
+            _intern_slot_types(parsed)
+            merged.update(parsed)
 
     logger.debug(f"Merged vehicle data: {len(merged)} parts from {len(seen_files)} files")
     return merged
@@ -511,7 +659,7 @@ def find_exhaust_slots_in_part(
 
         slot_type, default, _ = _extract_slot_fields(slot_entry)
 
-        if EXHAUST_SLOT_PATTERNS.search(slot_type):
+        if _EXHAUST_SEARCH(slot_type):
             exhaust_slots.append((slot_type, default))
 
     return exhaust_slots
@@ -544,11 +692,35 @@ def find_all_child_slots(
     return result
 
 
+def _build_slotType_index(parsed_data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Map each slotType to the parts filling it, in parsed_data order.
+
+    Callers that make many lookups against one dataset (chain tracing,
+    vehicle profiling) build this once and pass it down.
+    """
+    index: Dict[str, List[str]] = {}
+    for part_name, part_data in parsed_data.items():
+        if isinstance(part_data, dict):
+            st = part_data.get('slotType', '')
+            if isinstance(st, str):
+                index.setdefault(st, []).append(part_name)
+    return index
+
+
 def _find_part_by_slotType(
     parsed_data: Dict[str, Any],
     slot_type: str,
+    slot_index: Optional[Dict[str, List[str]]] = None,
 ) -> Optional[str]:
-    """Find the first part in parsed_data whose slotType matches."""
+    """Find the first part in parsed_data whose slotType matches.
+
+    Pass a prebuilt slot_index (from _build_slotType_index) when making many
+    lookups; without one this is a single first-match scan.
+    """
+    if slot_index is not None:
+        parts = slot_index.get(slot_type)
+        return parts[0] if parts else None
+
     for part_name, part_data in parsed_data.items():
         if isinstance(part_data, dict) and part_data.get('slotType', '') == slot_type:
             return part_name
@@ -622,6 +794,8 @@ def trace_exhaust_chain(
     engine_part_name: str,
     base_path: Path,
     vehicle_name: str,
+    slot_index: Optional[Dict[str, List[str]]] = None,
+    node_cache: Optional[_PartNodeCache] = None,
 ) -> List[ExhaustSlotInfo]:
     """Trace exhaust slot chains starting from an engine part.
 
@@ -630,69 +804,66 @@ def trace_exhaust_chain(
     2. Intermediate-hosted (intake → header → exhaust)
     3. Result includes chain path for pattern classification
 
-    Uses merged_data for cross-file part resolution.
+    Uses merged_data for cross-file part resolution. slot_index is the
+    slotType → parts index of merged_data; it is built here when omitted.
+    node_cache memoizes part nodes across calls on the same merged_data.
 
     Note: Pattern C (body/frame) detection is handled by classify_pattern(),
     not here — this function traces ENGINE-based chains only.
     """
     results: List[ExhaustSlotInfo] = []
+    if slot_index is None:
+        slot_index = _build_slotType_index(merged_data)
+    if node_cache is None:
+        node_cache = {}
 
     # --- Phase 1: Direct exhaust-related slots on the engine ---
     engine_exhaust_slots = find_exhaust_slots_in_part(merged_data, engine_part_name)
     all_engine_slots = find_all_child_slots(merged_data, engine_part_name)
 
     # Separate direct exhaust slots from header/manifold/downpipe slots
-    direct_exhaust_slots = [
-        (st, dv) for st, dv in engine_exhaust_slots
-        if 'exhaust' in st.lower()
-        and 'header' not in st.lower()
-        and 'manifold' not in st.lower()
-        and 'downpipe' not in st.lower()
-    ]
-
-    downstream_slots = [
-        (st, dv) for st, dv in engine_exhaust_slots
-        if 'header' in st.lower() or 'manifold' in st.lower()
-        or 'downpipe' in st.lower()
-    ]
+    direct_exhaust_slots: List[Tuple[str, str]] = []
+    downstream_slots: List[Tuple[str, str]] = []
+    for st, dv in engine_exhaust_slots:
+        if _DOWNSTREAM_STAGE_SEARCH(st):
+            downstream_slots.append((st, dv))
+        elif 'exhaust' in st.lower():
+            direct_exhaust_slots.append((st, dv))
 
     # Trace each downstream component (header/manifold/downpipe)
     for ds_type, ds_default in downstream_slots:
-        ds_part = _find_part_by_slotType(merged_data, ds_type)
+        ds_part = _find_part_by_slotType(merged_data, ds_type, slot_index)
         if not ds_part:
             continue
 
         ds_exhaust = find_exhaust_slots_in_part(merged_data, ds_part)
-        ds_nodes = _extract_part_nodes(merged_data, ds_part)
-        node_names = [n['name'] for n in ds_nodes]
-        node_positions = [(n['x'], n['y'], n['z']) for n in ds_nodes]
+        node_names, node_positions = _part_node_tuples(merged_data, ds_part, node_cache)
 
         # Check if downstream component has a final exhaust slot
         final_exhaust = [
             (st, dv) for st, dv in ds_exhaust
-            if 'exhaust' in st.lower()
-            and 'header' not in st.lower()
-            and 'manifold' not in st.lower()
-            and 'downpipe' not in st.lower()
+            if not _DOWNSTREAM_STAGE_SEARCH(st) and 'exhaust' in st.lower()
         ]
 
         if final_exhaust:
             for exh_type, _ in final_exhaust:
+                chain_path = f"{engine_part_name} → {ds_type}[{ds_part}] → {exh_type}"
                 results.append(ExhaustSlotInfo(
                     downstream_component_name=ds_part,
                     downstream_component_slotType=ds_type,
                     exhaust_slot_type=exh_type,
-                    chain_path=f"{engine_part_name} → {ds_type}[{ds_part}] → {exh_type}",
+                    chain_path=chain_path,
                     node_names=node_names,
                     node_positions=node_positions,
                 ))
         else:
             # Header exists but has no exhaust child (leaf node — Pattern A' indicator)
+            chain_path = f"{engine_part_name} → {ds_type}[{ds_part}] → ???"
             results.append(ExhaustSlotInfo(
                 downstream_component_name=ds_part,
                 downstream_component_slotType=ds_type,
-                exhaust_slot_type="(none found)",
-                chain_path=f"{engine_part_name} → {ds_type}[{ds_part}] → ???",
+                exhaust_slot_type=_NONE_FOUND,
+                chain_path=chain_path,
                 node_names=node_names,
                 node_positions=node_positions,
             ))
@@ -704,82 +875,69 @@ def trace_exhaust_chain(
             downstream_component_slotType=exh_type,
             exhaust_slot_type=exh_type,
             chain_path=f"{engine_part_name} → {exh_type} (sibling slot)",
-            node_names=[],
-            node_positions=[],
+            node_names=(),
+            node_positions=(),
         ))
 
     # --- Phase 2: Intermediate-hosted (intake → header → exhaust) ---
     if not downstream_slots:
         non_exhaust_slots = [
             (st, dv, desc) for st, dv, desc in all_engine_slots
-            if not EXHAUST_SLOT_PATTERNS.search(st)
+            if not _EXHAUST_SEARCH(st)
         ]
 
+        # Work-list of intermediate hosts: (slotType, part, strict_filter).
+        # The canonical part filling each slot is checked with the strict
+        # final-exhaust filter; alternate parts filling the same slot (turbo
+        # variants) accept any exhaust child. Processed in insertion order,
+        # so results keep the engine's slot order.
+        hosts: List[Tuple[str, str, bool]] = []
         for int_type, int_default, _ in non_exhaust_slots:
-            int_part = _find_part_by_slotType(merged_data, int_type)
+            int_part = _find_part_by_slotType(merged_data, int_type, slot_index)
             if not int_part:
                 continue
+            hosts.append((int_type, int_part, True))
+            for alt_name in slot_index[int_type]:
+                if alt_name != int_part:
+                    hosts.append((int_type, alt_name, False))
 
+        for int_type, host_part, strict in hosts:
             # Check if intermediate part has exhaust-related child slots
-            int_exhaust_slots = find_exhaust_slots_in_part(merged_data, int_part)
-            for ie_type, _ in int_exhaust_slots:
-                ie_part = _find_part_by_slotType(merged_data, ie_type)
+            for ie_type, _ in find_exhaust_slots_in_part(merged_data, host_part):
+                ie_part = _find_part_by_slotType(merged_data, ie_type, slot_index)
                 if not ie_part:
                     continue
 
                 ie_child_exhaust = find_exhaust_slots_in_part(merged_data, ie_part)
-                ie_nodes = _extract_part_nodes(merged_data, ie_part)
-
-                final = [
-                    (st, dv) for st, dv in ie_child_exhaust
-                    if 'exhaust' in st.lower()
-                    and 'header' not in st.lower()
-                    and 'downpipe' not in st.lower()
-                ]
-
-                if final:
-                    for exh_type, _ in final:
-                        results.append(ExhaustSlotInfo(
-                            downstream_component_name=ie_part,
-                            downstream_component_slotType=ie_type,
-                            exhaust_slot_type=exh_type,
-                            chain_path=(
-                                f"{engine_part_name} → {int_type}[{int_part}] → "
-                                f"{ie_type}[{ie_part}] → {exh_type}"
-                            ),
-                            node_names=[n['name'] for n in ie_nodes],
-                            node_positions=[(n['x'], n['y'], n['z']) for n in ie_nodes],
-                        ))
-
-            # Also check alternate parts filling the same slot (turbo variants)
-            for alt_name, alt_data in merged_data.items():
-                if not isinstance(alt_data, dict):
+                if strict:
+                    final = [
+                        (st, dv) for st, dv in ie_child_exhaust
+                        if 'exhaust' in st.lower()
+                        and 'header' not in st.lower()
+                        and 'downpipe' not in st.lower()
+                    ]
+                else:
+                    final = [
+                        (st, dv) for st, dv in ie_child_exhaust
+                        if 'exhaust' in st.lower()
+                    ]
+                if not final:
                     continue
-                if alt_data.get('slotType', '') == int_type and alt_name != int_part:
-                    alt_exhaust = find_exhaust_slots_in_part(merged_data, alt_name)
-                    for ae_type, _ in alt_exhaust:
-                        ae_part = _find_part_by_slotType(merged_data, ae_type)
-                        if not ae_part:
-                            continue
-                        ae_child = find_exhaust_slots_in_part(merged_data, ae_part)
-                        ae_nodes = _extract_part_nodes(merged_data, ae_part)
-                        ae_final = [
-                            (st, dv) for st, dv in ae_child
-                            if 'exhaust' in st.lower()
-                        ]
-                        if ae_final:
-                            for exh_type, _ in ae_final:
-                                results.append(ExhaustSlotInfo(
-                                    downstream_component_name=ae_part,
-                                    downstream_component_slotType=ae_type,
-                                    exhaust_slot_type=exh_type,
-                                    chain_path=(
-                                        f"{engine_part_name} → {int_type}[{alt_name}] → "
-                                        f"{ae_type}[{ae_part}] → {exh_type}"
-                                    ),
-                                    node_names=[n['name'] for n in ae_nodes],
-                                    node_positions=[(n['x'], n['y'], n['z']) for n in ae_nodes],
-                                ))
+
+                ie_names, ie_positions = _part_node_tuples(merged_data, ie_part, node_cache)
+                for exh_type, _ in final:
+                    chain_path = (
+                        f"{engine_part_name} → {int_type}[{host_part}] → "
+                        f"{ie_type}[{ie_part}] → {exh_type}"
+                    )
+                    results.append(ExhaustSlotInfo(
+                        downstream_component_name=ie_part,
+                        downstream_component_slotType=ie_type,
+                        exhaust_slot_type=exh_type,
+                        chain_path=chain_path,
+                        node_names=ie_names,
+                        node_positions=ie_positions,
+                    ))
 
     return results
 
@@ -788,6 +946,14 @@ def trace_exhaust_chain(
 # Pattern Classification
 # =========================================================================
 
+# Pattern for the first chain with a non-empty ChainKind (sibling wins)
+_PATTERN_BY_CHAIN_KIND = {
+    ChainKind.SIBLING: "A'",
+    ChainKind.VIA_INTAKE: "B",
+    ChainKind.SIBLING | ChainKind.VIA_INTAKE: "A'",
+}
+
+
 def classify_pattern(
     chains: List[ExhaustSlotInfo],
     base_path: Path,
@@ -804,49 +970,33 @@ def classify_pattern(
       C  — body/frame hosts exhaust slot (decoupled from engine chain)
       no_exhaust — no exhaust system found anywhere
     """
-    body_exhaust = find_body_frame_exhaust_slots(
-        base_path, vehicle_name, merged_data=merged_data
-    )
-
-    if not chains:
-        if body_exhaust:
+    # Chains that never reach a real exhaust slot defer to the body/frame
+    # scan, which is only run when one of those two cases applies.
+    if not chains or all(c.exhaust_slot_type == _NONE_FOUND for c in chains):
+        if find_body_frame_exhaust_slots(
+            base_path, vehicle_name, merged_data=merged_data
+        ):
             return "C"
-        return "no_exhaust"
+        if not chains:
+            return "no_exhaust"
 
-    # Check if any chain has a real exhaust slot (not "(none found)")
-    has_real_exhaust = any(
-        c.exhaust_slot_type != "(none found)" for c in chains
-    )
-
-    # If chains exist but none reach an exhaust slot, check body/frame
-    if not has_real_exhaust and body_exhaust:
-        return "C"
-
-    # Check chain paths for pattern indicators
+    # The first chain carrying any structural flag decides A' / B
     for chain in chains:
-        path_lower = chain.chain_path.lower()
-        if 'sibling' in path_lower:
-            return "A'"
-        if 'intake' in path_lower or 'turbo' in path_lower:
-            return "B"
-
-    # Check if engine has both header AND sibling exhaust (A' indicator)
-    all_engine_slots = find_all_child_slots(merged_data, engine_part)
-    has_sibling_exhaust = any(
-        'exhaust' in st.lower()
-        and 'header' not in st.lower()
-        and 'manifold' not in st.lower()
-        for st, _, _ in all_engine_slots
-    )
-    has_header = any(
-        'header' in st.lower() or 'manifold' in st.lower()
-        for st, _, _ in all_engine_slots
-    )
+        if chain.kind:
+            return _PATTERN_BY_CHAIN_KIND[chain.kind]
 
-    if has_sibling_exhaust and has_header:
-        return "A'"
+    # Otherwise decide on the engine's own slots: a sibling exhaust next to
+    # a header/manifold means A', anything else is A
+    has_sibling_exhaust = False
+    has_header = False
+    for st, _, _ in find_all_child_slots(merged_data, engine_part):
+        st_lower = st.lower()
+        if 'header' in st_lower or 'manifold' in st_lower:
+            has_header = True
+        elif 'exhaust' in st_lower:
+            has_sibling_exhaust = True
 
-    return "A"
+    return "A'" if has_sibling_exhaust and has_header else "A"
 
 
 # =========================================================================
@@ -897,18 +1047,28 @@ def profile_vehicle_exhausts(
         logger.warning(f"No engine files found for {vehicle_name}")
         return []
 
+    # Engine files are parsed once here and reused for per-file profiling
+    parsed_files: Dict[Path, Dict[str, Any]] = {}
     merged_data = build_merged_vehicle_data(
-        base_path, vehicle_name, engine_files, exhaust_files, family_prefix
+        base_path, vehicle_name, engine_files, exhaust_files, family_prefix,
+        parsed_files=parsed_files,
     )
 
+    # One slotType index and part-node cache serve every engine traced
+    # against merged_data
+    slot_index = _build_slotType_index(merged_data)
+    node_cache: _PartNodeCache = {}
+
     profiles: List[EngineExhaustProfile] = []
 
     for engine_file in engine_files:
-        try:
-            parsed = JBeamParser.parse_jbeam(engine_file)
-        except Exception as e:
-            logger.warning(f"Error parsing {engine_file.name}: {e}")
-            continue
+        parsed = parsed_files.get(engine_file)
+        if parsed is None:
+            try:
+                parsed = JBeamParser.parse_jbeam(engine_file)
+            except Exception as e:
+                logger.warning(f"Error parsing {engine_file.name}: {e}")
+                continue
 
         if not parsed:
             continue
@@ -932,7 +1092,8 @@ def profile_vehicle_exhausts(
             ]
 
             exhaust_chains = trace_exhaust_chain(
-                merged_data, part_name, base_path, vehicle_name
+                merged_data, part_name, base_path, vehicle_name,
+                slot_index, node_cache,
             )
 
             pattern = classify_pattern(
@@ -982,17 +1143,14 @@ def classify_candidates(
     mismatch: List[EngineExhaustProfile] = []
 
     for profile in profiles:
-        if profile.is_exhaust_count == 0:
-            continue  # no isExhaust nodes at all — skip
-        if profile.is_exhaust_count > 2:
-            continue  # complex/race engine — skip
+        count = profile.is_exhaust_count
+        # 0 → no isExhaust nodes at all; >2 → complex/race engine
+        if not 0 < count <= 2:
+            continue
         if profile.pattern == 'no_exhaust':
             continue  # no exhaust system found — skip
 
-        if profile.is_exhaust_count == donor_count:
-            matching.append(profile)
-        else:
-            mismatch.append(profile)
+        (matching if count == donor_count else mismatch).append(profile)
 
     return matching, mismatch
 
@@ -1011,7 +1169,7 @@ def _select_best_candidate(
 
     def sort_key(p: EngineExhaustProfile) -> Tuple[int, int, str]:
         has_real = any(
-            s.exhaust_slot_type != "(none found)" for s in p.exhaust_slots
+            s.exhaust_slot_type != _NONE_FOUND for s in p.exhaust_slots
         )
         return (
             0 if has_real else 1,
@@ -1025,7 +1183,7 @@ def _select_best_candidate(
 def _get_exhaust_slot_type(profile: EngineExhaustProfile) -> Optional[str]:
     """Extract the downstream exhaust slotType from a profile."""
     for slot_info in profile.exhaust_slots:
-        if slot_info.exhaust_slot_type != "(none found)":
+        if slot_info.exhaust_slot_type != _NONE_FOUND:
             return slot_info.exhaust_slot_type
     return None
 
@@ -1052,19 +1210,15 @@ def _find_bridge_nodes_in_engine_ecosystem(
         - source_part_name: Part that defined the nodes, or None.
     """
     engine_slots = find_all_child_slots(merged_data, engine_part_name)
+    slot_index = _build_slotType_index(merged_data)
 
     for slot_type, _, _ in engine_slots:
         # Skip exhaust-related slots (already handled by standard path)
-        if EXHAUST_SLOT_PATTERNS.search(slot_type):
+        if _EXHAUST_SEARCH(slot_type):
             continue
 
         # Check all parts that fill this slot type
-        for part_name, part_data in merged_data.items():
-            if not isinstance(part_data, dict):
-                continue
-            if part_data.get('slotType', '') != slot_type:
-                continue
-
+        for part_name in slot_index.get(slot_type, ()):
             all_nodes = _extract_part_nodes_full(merged_data, part_name)
             bridge_nodes = [
                 n for n in all_nodes
@@ -1093,18 +1247,17 @@ def _get_best_exhaust_slot_info(
     Prefers chains that have actual downstream nodes (Pattern A/B)
     over sibling chains (Pattern A') which have empty node lists.
     """
-    real_chains = [
-        s for s in profile.exhaust_slots
-        if s.exhaust_slot_type != "(none found)"
-    ]
-    if not real_chains:
-        return None
-
-    # Prefer chains with nodes (these are from actual downstream components)
-    with_nodes = [c for c in real_chains if c.node_names]
-    if with_nodes:
-        return with_nodes[0]
-    return real_chains[0]
+    # Single pass: the first real chain with nodes (an actual downstream
+    # component) wins outright; otherwise fall back to the first real chain.
+    first_real: Optional[ExhaustSlotInfo] = None
+    for c in profile.exhaust_slots:
+        if c.exhaust_slot_type == _NONE_FOUND:
+            continue
+        if c.node_names:
+            return c
+        if first_real is None:
+            first_real = c
+    return first_real
 
 
 # =========================================================================
@@ -1132,6 +1285,35 @@ _DEFAULT_BEAM_PROPS = {
 # while still borrowing from the target when the value is reasonable.
 _MAX_BEAM_SPRING = 1616333
 
+# Fixed structural beam modifier rows; copied per component so callers can
+# edit the emitted part without touching these prototypes
+_BEAM_DEFORM_LIMIT_ROW = {"deformLimitExpansion": 1.2}
+_BEAM_TYPE_ROW = {
+    "beamPrecompression": 1,
+    "beamType": "|NORMAL",
+    "beamLongBound": 1.0,
+    "beamShortBound": 1.0,
+}
+
+# Fixed adapted-node modifier rows (BeamNG convention: one property per row)
+# and the trailing group reset; copied per component like the beam rows above
+_ADAPTED_NODE_MODIFIER_ROWS = (
+    {"selfCollision": False},
+    {"collision": False},
+    {"frictionCoef": 0.5},
+    {"nodeMaterial": "|NM_METAL"},
+    {"nodeWeight": 4.5},
+    {"group": "exhaust_adapter"},
+)
+_ADAPTED_NODE_TRAILER_ROW = {"group": "none"}
+
+# Shared read-only props for nodes without inline properties; most nodes
+# carry none, so this avoids one empty dict per extracted node
+_EMPTY_PROPS: Mapping[str, Any] = types.MappingProxyType({})
+
+# BeamNG standard engine cube node names (structural beam anchors)
+_ENGINE_CUBE_NODES = ('e1l', 'e1r', 'e2l', 'e2r', 'e3l', 'e3r', 'e4l', 'e4r')
+
 
 def _extract_part_nodes_full(
     parsed_data: Dict[str, Any],
@@ -1144,7 +1326,8 @@ def _extract_part_nodes_full(
 
     Returns:
         List of dicts: {name, x, y, z, props: {}} where props holds any
-        inline dict properties from the node row.
+        inline dict properties from the node row. Nodes without inline
+        properties share a read-only empty mapping.
     """
     part_data = parsed_data.get(part_name, {})
     if not isinstance(part_data, dict):
@@ -1156,23 +1339,29 @@ def _extract_part_nodes_full(
 
     nodes = []
     for item in nodes_section:
-        if not isinstance(item, list) or len(item) < 4:
+        if type(item) is not list or len(item) < 4:
             continue
-        if isinstance(item[0], str) and item[0] in ('id', 'id1', 'id2'):
+        first = item[0]
+        if type(first) is str and first in _NODE_HEADER_IDS:
             continue
 
+        # Node columns are positional (id, posX, posY, posZ, ...) in every
+        # jbeam nodes section, so the header row is skipped, never mapped
+        pos_z = item[3]
         try:
-            name = str(item[0]).rstrip(',').strip('"')
+            name = str(first).rstrip(',').strip('"')
             x = float(item[1])
             y = float(item[2])
-            z = float(item[3]) if not isinstance(item[3], dict) else 0.0
+            z = 0.0 if type(pos_z) is dict else float(pos_z)
         except (TypeError, ValueError):
             continue
 
         # Collect inline properties from any dict items in the row
-        props: Dict[str, Any] = {}
+        props: Mapping[str, Any] = _EMPTY_PROPS
         for el in item[3:]:
-            if isinstance(el, dict):
+            if type(el) is dict:
+                if props is _EMPTY_PROPS:
+                    props = {}
                 props.update(el)
 
         nodes.append({'name': name, 'x': x, 'y': y, 'z': z, 'props': props})
@@ -1203,16 +1392,18 @@ def _extract_beam_properties_from_part(
     for item in beams_section:
         if isinstance(item, dict) and 'beamSpring' in item:
             result = dict(_DEFAULT_BEAM_PROPS)
-            for key in ('beamSpring', 'beamDamp', 'beamDeform', 'beamStrength'):
+            for key in ('beamDamp', 'beamDeform', 'beamStrength'):
                 if key in item:
                     result[key] = item[key]
             # Clamp beamSpring to prevent instant beam breakage on load
-            if isinstance(result['beamSpring'], (int, float)) and result['beamSpring'] > _MAX_BEAM_SPRING:
+            spring = item['beamSpring']
+            if isinstance(spring, (int, float)) and spring > _MAX_BEAM_SPRING:
                 logger.warning(
                     "  [EXH] Clamped beamSpring %s -> %s (max limit)",
-                    result['beamSpring'], _MAX_BEAM_SPRING,
+                    spring, _MAX_BEAM_SPRING,
                 )
-                result['beamSpring'] = _MAX_BEAM_SPRING
+                spring = _MAX_BEAM_SPRING
+            result['beamSpring'] = spring
             return result
 
     return dict(_DEFAULT_BEAM_PROPS)
@@ -1223,11 +1414,7 @@ def _euclidean_distance(
     pos_b: Tuple[float, float, float],
 ) -> float:
     """Euclidean distance between two 3D positions."""
-    return math.sqrt(
-        (pos_a[0] - pos_b[0]) ** 2 +
-        (pos_a[1] - pos_b[1]) ** 2 +
-        (pos_a[2] - pos_b[2]) ** 2,
-    )
+    return math.dist(pos_a, pos_b)
 
 
 def generate_adapted_nodes(
@@ -1249,29 +1436,23 @@ def generate_adapted_nodes(
         return rows
 
     # Node property modifiers — separate rows per BeamNG convention
-    rows.append({"selfCollision": False})
-    rows.append({"collision": False})
-    rows.append({"frictionCoef": 0.5})
-    rows.append({"nodeMaterial": "|NM_METAL"})
-    rows.append({"nodeWeight": 4.5})
-    rows.append({"group": "exhaust_adapter"})
+    rows.extend([dict(r) for r in _ADAPTED_NODE_MODIFIER_ROWS])
 
     for node in downstream_nodes:
         row: List[Any] = [node['name'], node['x'], node['y'], node['z']]
 
         # Preserve audio properties inline
-        audio_props: Dict[str, Any] = {}
-        for key, val in node.get('props', {}).items():
-            if key in _AUDIO_PROPS:
-                audio_props[key] = val
-
+        audio_props = {
+            key: val for key, val in node.get('props', _EMPTY_PROPS).items()
+            if key in _AUDIO_PROPS
+        }
         if audio_props:
             row.append(audio_props)
 
         rows.append(row)
 
     # Trailing group reset — prevents group leaking to subsequent sections
-    rows.append({"group": "none"})
+    rows.append(dict(_ADAPTED_NODE_TRAILER_ROW))
 
     return rows
 
@@ -1298,13 +1479,8 @@ def generate_structural_beams(
     rows: List[List[Any]] = [["id1:", "id2:"]]
 
     # Beam property modifiers — separate rows per BeamNG convention
-    rows.append({"deformLimitExpansion": 1.2})
-    rows.append({
-        "beamPrecompression": 1,
-        "beamType": "|NORMAL",
-        "beamLongBound": 1.0,
-        "beamShortBound": 1.0,
-    })
+    rows.append(dict(_BEAM_DEFORM_LIMIT_ROW))
+    rows.append(dict(_BEAM_TYPE_ROW))
     rows.append({
         "beamSpring": min(beam_props.get("beamSpring", _DEFAULT_BEAM_PROPS['beamSpring']), _MAX_BEAM_SPRING),
         "beamDamp": beam_props.get("beamDamp", 130.43),
@@ -1316,17 +1492,18 @@ def generate_structural_beams(
 
     # Determine non-isExhaust engine nodes (for structural connections)
     # Use BeamNG standard engine cube node names, excluding those that carry isExhaust
-    is_exhaust_names = {n.name for n in engine_nodes}
-    all_engine_cube_names = ['e1l', 'e1r', 'e2l', 'e2r', 'e3l', 'e3r', 'e4l', 'e4r']
-    structural_targets = [n for n in all_engine_cube_names if n not in is_exhaust_names]
+    is_exhaust_names = frozenset(n.name for n in engine_nodes)
+    structural_targets = [n for n in _ENGINE_CUBE_NODES if n not in is_exhaust_names]
 
     if not structural_targets:
         # Fallback: if all 8 nodes are isExhaust (shouldn't happen), use bottom 4
-        structural_targets = ['e1l', 'e1r', 'e2l', 'e2r']
+        structural_targets = list(_ENGINE_CUBE_NODES[:4])
 
-    for ds_node in downstream_nodes:
-        for eng_node in structural_targets:
-            rows.append([ds_node['name'], eng_node])
+    rows.extend(
+        [ds_name, eng_node]
+        for ds_name in [n['name'] for n in downstream_nodes]
+        for eng_node in structural_targets
+    )
 
     return rows
 
@@ -1347,57 +1524,39 @@ def generate_matching_isExhaust_beams(
     Returns:
         List of jbeam beam rows with isExhaust properties.
     """
-    rows: List[List[Any]] = []
-
     if not donor_nodes or not downstream_nodes:
-        return rows
+        return []
 
+    rows: List[List[Any]] = []
     count = len(donor_nodes)
-    ds_positions = [
-        (n['name'], (n['x'], n['y'], n['z'])) for n in downstream_nodes
-    ]
 
-    if count == 1:
-        # 1↔1: direct connection to first downstream node
-        rows.append([
-            donor_nodes[0].name,
-            ds_positions[0][0],
-            {"isExhaust": "mainEngine"},
-        ])
-    elif count == 2 and len(ds_positions) >= 2:
-        # 2↔2: distance-paired matching
-        # Calculate all pairings and pick the one with minimum total distance
-        donor_positions = [
-            (n.name, (n.x, n.y, n.z)) for n in donor_nodes
-        ]
+    if count == 2 and len(downstream_nodes) >= 2:
+        # 2↔2: distance-paired matching. With two nodes per side there are
+        # only two assignments, so compare both total distances directly.
+        d0, d1 = donor_nodes
+        ds0, ds1 = downstream_nodes[0], downstream_nodes[1]
+        d0_pos, d1_pos = d0.pos, d1.pos
+        ds0_pos = (ds0['x'], ds0['y'], ds0['z'])
+        ds1_pos = (ds1['x'], ds1['y'], ds1['z'])
 
         # Pairing A: donor[0]→ds[0], donor[1]→ds[1]
-        dist_a = (
-            _euclidean_distance(donor_positions[0][1], ds_positions[0][1]) +
-            _euclidean_distance(donor_positions[1][1], ds_positions[1][1])
-        )
+        dist_a = _euclidean_distance(d0_pos, ds0_pos) + _euclidean_distance(d1_pos, ds1_pos)
         # Pairing B: donor[0]→ds[1], donor[1]→ds[0]
-        dist_b = (
-            _euclidean_distance(donor_positions[0][1], ds_positions[1][1]) +
-            _euclidean_distance(donor_positions[1][1], ds_positions[0][1])
-        )
+        dist_b = _euclidean_distance(d0_pos, ds1_pos) + _euclidean_distance(d1_pos, ds0_pos)
 
         if dist_a <= dist_b:
-            pairs = [(0, 0), (1, 1)]
+            pairs = [(d0, ds0), (d1, ds1)]
         else:
-            pairs = [(0, 1), (1, 0)]
-
-        for di, dsi in pairs:
-            rows.append([
-                donor_positions[di][0],
-                ds_positions[dsi][0],
-                {"isExhaust": "mainEngine"},
-            ])
+            pairs = [(d0, ds1), (d1, ds0)]
+
+        for donor, ds in pairs:
+            rows.append([donor.name, ds['name'], {"isExhaust": "mainEngine"}])
     else:
-        # Fallback for unexpected counts: connect first to first
+        # 1↔1 (and fallback for unexpected counts): connect the first
+        # donor node to the first downstream node
         rows.append([
             donor_nodes[0].name,
-            ds_positions[0][0],
+            downstream_nodes[0]['name'],
             {"isExhaust": "mainEngine"},
         ])
 
@@ -1416,17 +1575,15 @@ def generate_mismatch_isExhaust_beams(
     Returns:
         List of jbeam beam rows for Y-pipe wiring.
     """
-    rows: List[List[Any]] = []
-
-    for donor_node in donor_nodes:
-        for ds_node in downstream_nodes:
-            rows.append([
-                donor_node.name,
-                ds_node['name'],
-                {"isExhaust": "mainEngine"},
-            ])
+    if not donor_nodes or not downstream_nodes:
+        return []
 
-    return rows
+    # Each row gets its own props dict, as in generate_matching_isExhaust_beams
+    return [
+        [donor_node.name, ds_node['name'], {"isExhaust": "mainEngine"}]
+        for donor_node in donor_nodes
+        for ds_node in downstream_nodes
+    ]
 
 
 def generate_slot_entry(
@@ -1499,6 +1656,7 @@ def generate_adapted_exhaust_component(
 
     # Extract downstream component nodes with full properties
     downstream_nodes = _extract_part_nodes_full(merged_data, ds_component_name)
+    beam_props: Optional[Dict[str, Any]] = None
 
     if not downstream_nodes:
         # A' Direct fallback — bridge nodes may be in intake/turbo sub-parts
@@ -1510,6 +1668,7 @@ def generate_adapted_exhaust_component(
         if bridge_nodes:
             downstream_nodes = bridge_nodes
             ds_component_name = eco_part
+            beam_props = eco_beam_props
         else:
             warnings.append(
                 f"No nodes found in downstream component "
@@ -1518,8 +1677,10 @@ def generate_adapted_exhaust_component(
             )
             return None, None, warnings
 
-    # Extract beam properties from downstream component
-    beam_props = _extract_beam_properties_from_part(merged_data, ds_component_name)
+    # Extract beam properties from downstream component (the ecosystem
+    # fallback already extracted them from the bridge part)
+    if beam_props is None:
+        beam_props = _extract_beam_properties_from_part(merged_data, ds_component_name)
 
     # --- Generate nodes ---
     adapted_nodes = generate_adapted_nodes(downstream_nodes)
@@ -293,6 +293,15 @@ class EngineCube:
         
         return [self.nodes[n] for n in bottom_names if n in self.nodes]
     
+    def get_exhaust_nodes(self) -> List[EngineNode]:
+        """
+        Return the nodes carrying isExhaust, in cube order.
+        
+        Computed per call rather than cached: node_properties is edited in
+        place (gearbox isExhaust promotion), so a stored view could go stale.
+        """
+        return [n for n in self.nodes.values() if n.node_properties.get("isExhaust")]
+    
     def get_plane_centroid(self, nodes: List[EngineNode]) -> Vec3:
         """Calculate centroid of a set of nodes (for plane alignment)."""
         if not nodes:
@@ -313,17 +322,11 @@ class EngineCube:
         if not self.nodes:
             return (Vec3(0, 0, 0), Vec3(0, 0, 0))
         
+        # Transpose once into per-axis tuples rather than six generator passes
         positions = [n.position for n in self.nodes.values()]
-        min_corner = Vec3(
-            min(p.x for p in positions),
-            min(p.y for p in positions),
-            min(p.z for p in positions)
-        )
-        max_corner = Vec3(
-            max(p.x for p in positions),
-            max(p.y for p in positions),
-            max(p.z for p in positions)
-        )
+        xs, ys, zs = zip(*[(p.x, p.y, p.z) for p in positions])
+        min_corner = Vec3(min(xs), min(ys), min(zs))
+        max_corner = Vec3(max(xs), max(ys), max(zs))
         return (min_corner, max_corner)
     
     def contains_point(self, point: Vec3, margin: float = 0.0) -> bool:
@@ -791,43 +794,46 @@ class DonorEngineExtractor:
         """
         Z_TOLERANCE = 0.15  # metres — floor-plane membership tolerance
 
+        gearbox_names = frozenset(self.CAMSO_GEARBOX_NODES)
         gearbox_with_exhaust = [
             (name, node) for name, node in nodes.items()
-            if name in self.CAMSO_GEARBOX_NODES
+            if name in gearbox_names
             and node.node_properties.get("isExhaust")
         ]
 
         if not gearbox_with_exhaust:
             return
 
-        cube_nodes = {
-            name: node for name, node in nodes.items()
-            if name in self.CAMSO_ENGINE_NODES
-        }
+        # Constraints 2 and 3 don't depend on the gearbox node, so the pool
+        # of (name, position) candidates is filtered once up front; a node
+        # leaves the pool when it receives isExhaust (no double-assignment)
+        cube_names = frozenset(self.CAMSO_ENGINE_NODES)
+        eligible = [
+            (name, node.position.to_tuple()) for name, node in nodes.items()
+            if name in cube_names
+            # --- Constraint 2: not an intake node ---
+            and "engine_intake" not in node.node_properties.get("engineGroup", [])
+            # --- Constraint 3: not already carrying isExhaust ---
+            and not node.node_properties.get("isExhaust")
+        ]
 
         for gb_name, gb_node in gearbox_with_exhaust:
-            best_name: Optional[str] = None
+            gb_pos = gb_node.position.to_tuple()
+            gb_z = gb_pos[2]
+            best_index: Optional[int] = None
             best_dist = float("inf")
 
-            for cube_name, cube_node in cube_nodes.items():
+            for i, (_, cube_pos) in enumerate(eligible):
                 # --- Constraint 1: floor-plane Z match ---
-                if abs(cube_node.position.z - gb_node.position.z) > Z_TOLERANCE:
-                    continue
-
-                # --- Constraint 2: not an intake node ---
-                engine_group = cube_node.node_properties.get("engineGroup", [])
-                if "engine_intake" in engine_group:
-                    continue
-
-                # --- Constraint 3: not already carrying isExhaust ---
-                if cube_node.node_properties.get("isExhaust"):
+                if abs(cube_pos[2] - gb_z) > Z_TOLERANCE:
                     continue
 
-                dist = (cube_node.position - gb_node.position).magnitude()
+                dist = math.dist(cube_pos, gb_pos)
                 if dist < best_dist:
                     best_dist = dist
-                    best_name = cube_name
+                    best_index = i
 
+            best_name = eligible.pop(best_index)[0] if best_index is not None else None
             if best_name is not None:
                 is_exhaust_value = gb_node.node_properties.pop("isExhaust")
                 nodes[best_name].node_properties["isExhaust"] = is_exhaust_value
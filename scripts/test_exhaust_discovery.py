@@ -17,8 +17,10 @@ Run from scripts/ directory:
 import sys
 import os
 import re
+import glob
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, NamedTuple
 from dataclasses import dataclass, field
@@ -49,15 +51,29 @@ class IsExhaustNode:
     source_part: str
     source_file: str
 
-@dataclass
+@dataclass(frozen=True)
 class ExhaustSlotInfo:
-    """Result of tracing an exhaust slot chain."""
+    """Result of tracing an exhaust slot chain.
+
+    Frozen and hashable so identical chains shared by engine variants of the
+    same vehicle can be interned (see trace_exhaust_chain).
+    """
     downstream_component_name: str       # e.g. "pickup_header_v8"
     downstream_component_slotType: str   # e.g. "pickup_header_v8"
     exhaust_slot_type: str               # e.g. "pickup_exhaust_v8"
     chain_path: str                      # human-readable chain
-    node_names: List[str] = field(default_factory=list)
-    node_positions: List[Tuple[float, float, float]] = field(default_factory=list)
+    node_names: Tuple[str, ...] = ()
+    node_positions: Tuple[Tuple[float, float, float], ...] = ()
+    # Pattern markers derived once from chain_path (read by classify_pattern)
+    is_sibling: bool = field(init=False, default=False, compare=False)
+    via_intake: bool = field(init=False, default=False, compare=False)
+    via_turbo: bool = field(init=False, default=False, compare=False)
+
+    def __post_init__(self):
+        path_lower = self.chain_path.lower()
+        object.__setattr__(self, 'is_sibling', 'sibling' in path_lower)
+        object.__setattr__(self, 'via_intake', 'intake' in path_lower)
+        object.__setattr__(self, 'via_turbo', 'turbo' in path_lower)
 
 @dataclass
 class EngineExhaustProfile:
@@ -77,6 +93,14 @@ class EngineExhaustProfile:
 EXHAUST_SLOT_PATTERNS = re.compile(
     r'(header|exhmanifold|exhaust|downpipe)', re.IGNORECASE
 )
+_EXHAUST_SEARCH = EXHAUST_SLOT_PATTERNS.search
+
+# Sentinel exhaust_slot_type for chains without a real exhaust slot; interned
+# so != comparisons against it short-circuit on identity
+_NONE_FOUND = sys.intern("(none found)")
+
+# Header row markers in nodes sections
+_NODE_HEADER_KEYS = frozenset(('id', 'id1', 'id2'))
 
 def extract_isExhaust_nodes(
     parsed_data: Dict[str, Any],
@@ -126,7 +150,8 @@ def extract_isExhaust_nodes(
                 continue
 
             # Skip header rows
-            if isinstance(item[0], str) and item[0] in ('id', 'id1', 'id2'):
+            h = item[0]
+            if type(h) is str and h in _NODE_HEADER_KEYS:
                 continue
 
             node_name = item[0] if isinstance(item[0], str) else str(item[0])
@@ -197,7 +222,8 @@ def extract_all_engine_block_nodes(
 
         if not isinstance(item, list) or len(item) < 4:
             continue
-        if isinstance(item[0], str) and item[0] in ('id', 'id1', 'id2'):
+        h = item[0]
+        if type(h) is str and h in _NODE_HEADER_KEYS:
             continue
 
         node_name = str(item[0]).rstrip(',').strip('"')
@@ -225,7 +251,9 @@ def extract_all_engine_block_nodes(
 # =====================================================================
 
 # Header rows for slots and slots2 formats
-SLOTS_HEADER_KEYS = {'type', 'default', 'name', 'allowTypes', 'denyTypes', 'description'}
+SLOTS_HEADER_KEYS = frozenset(
+    ('type', 'default', 'name', 'allowTypes', 'denyTypes', 'description')
+)
 
 
 def _get_combined_slots(part_data: Dict[str, Any]) -> List:
@@ -240,44 +268,86 @@ def _get_combined_slots(part_data: Dict[str, Any]) -> List:
 
 def _is_slot_header(slot_entry: list) -> bool:
     """Check if a slot entry is a header row."""
-    return isinstance(slot_entry[0], str) and slot_entry[0] in SLOTS_HEADER_KEYS
+    h = slot_entry[0]
+    return type(h) is str and h in SLOTS_HEADER_KEYS
 
 
-def find_exhaust_slots_in_part(
-    parsed_data: Dict[str, Any],
-    part_name: str
-) -> List[Tuple[str, str]]:
-    """Find exhaust-related child slots defined by a part.
+def _scan_slots_v1(slots: List, out: List[Tuple[str, str, str]]) -> None:
+    """Append (slotType, default, description) rows from a legacy 'slots' list.
 
-    Handles both legacy 'slots' and modern 'slots2' formats.
-    Returns list of (slotType, default_value) tuples.
+    slots format: [slotType, default, description]
     """
-    part_data = parsed_data.get(part_name, {})
-    if not isinstance(part_data, dict):
-        return []
+    for slot_entry in slots:
+        if not isinstance(slot_entry, list) or len(slot_entry) < 2:
+            continue
+        if _is_slot_header(slot_entry):
+            continue
+        out.append((
+            str(slot_entry[0]),
+            str(slot_entry[1]),
+            str(slot_entry[2]) if len(slot_entry) > 2 else "",
+        ))
 
-    slots = _get_combined_slots(part_data)
 
-    exhaust_slots = []
+def _scan_slots_v2(slots: List, out: List[Tuple[str, str, str]]) -> None:
+    """Append (slotType, default, description) rows from a 'slots2' list.
+
+    slots2 format: [name, allowTypes, denyTypes, default, description]
+    """
     for slot_entry in slots:
         if not isinstance(slot_entry, list) or len(slot_entry) < 2:
             continue
         if _is_slot_header(slot_entry):
             continue
+        n = len(slot_entry)
+        out.append((
+            str(slot_entry[0]),
+            str(slot_entry[3]) if n > 3 else "",
+            str(slot_entry[4]) if n > 4 else "",
+        ))
+
 
-        slot_type = str(slot_entry[0])
-        # slots2 format: [name, allowTypes, denyTypes, default, description]
-        # slots format:  [slotType, default, description]
-        if isinstance(slot_entry[1], list):
-            # slots2 format — default is at index 3
-            default = str(slot_entry[3]) if len(slot_entry) > 3 else ""
+def _iter_child_slot_rows(part_data: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """Collect (slotType, default, description) rows from 'slots' and 'slots2'.
+
+    Entries within one slot list share a format, so the format is detected
+    once per list (a list at index 1 means slots2) and a specialized scanner
+    handles every row without per-entry dispatch.
+    """
+    rows: List[Tuple[str, str, str]] = []
+    for key in ('slots', 'slots2'):
+        slots = part_data.get(key)
+        if not isinstance(slots, list):
+            continue
+        is_v2 = any(
+            isinstance(e, list) and len(e) > 1 and isinstance(e[1], list)
+            for e in slots
+        )
+        if is_v2:
+            _scan_slots_v2(slots, rows)
         else:
-            default = str(slot_entry[1]) if len(slot_entry) > 1 else ""
+            _scan_slots_v1(slots, rows)
+    return rows
+
+
+def find_exhaust_slots_in_part(
+    parsed_data: Dict[str, Any],
+    part_name: str
+) -> List[Tuple[str, str]]:
+    """Find exhaust-related child slots defined by a part.
 
-        if EXHAUST_SLOT_PATTERNS.search(slot_type):
-            exhaust_slots.append((slot_type, default))
+    Handles both legacy 'slots' and modern 'slots2' formats.
+    Returns list of (slotType, default_value) tuples.
+    """
+    part_data = parsed_data.get(part_name, {})
+    if not isinstance(part_data, dict):
+        return []
 
-    return exhaust_slots
+    return [
+        (slot_type, default)
+        for slot_type, default, _ in _iter_child_slot_rows(part_data)
+        if _EXHAUST_SEARCH(slot_type)
+    ]
 
 
 def find_all_child_slots(
@@ -293,35 +363,21 @@ def find_all_child_slots(
     if not isinstance(part_data, dict):
         return []
 
-    slots = _get_combined_slots(part_data)
-
-    result = []
-    for slot_entry in slots:
-        if not isinstance(slot_entry, list) or len(slot_entry) < 2:
-            continue
-        if _is_slot_header(slot_entry):
-            continue
+    return _iter_child_slot_rows(part_data)
 
-        slot_type = str(slot_entry[0])
-        # Handle both formats
-        if isinstance(slot_entry[1], list):
-            # slots2: [name, allowTypes, denyTypes, default, description]
-            default = str(slot_entry[3]) if len(slot_entry) > 3 else ""
-            desc = str(slot_entry[4]) if len(slot_entry) > 4 else ""
-        else:
-            # slots: [slotType, default, description]
-            default = str(slot_entry[1]) if len(slot_entry) > 1 else ""
-            desc = str(slot_entry[2]) if len(slot_entry) > 2 else ""
-        result.append((slot_type, default, desc))
 
-    return result
+def _is_final_exhaust(st_lower: str) -> bool:
+    """True for a terminal exhaust slot type (expects an already-lowercased name)."""
+    return ('exhaust' in st_lower and 'header' not in st_lower
+            and 'manifold' not in st_lower and 'downpipe' not in st_lower)
 
 
 def trace_exhaust_chain(
     parsed_data: Dict[str, Any],
     engine_part_name: str,
     source_file: str,
-    vehicle_name: str
+    vehicle_name: str,
+    intern: Optional[Dict[ExhaustSlotInfo, ExhaustSlotInfo]] = None
 ) -> List[ExhaustSlotInfo]:
     """Trace exhaust slot chains starting from an engine part.
 
@@ -329,6 +385,10 @@ def trace_exhaust_chain(
     1. Direct engine slots (header, exhaust, manifold, downpipe)
     2. Intermediate-hosted (intake → header → exhaust, turbo → downpipe → exhaust)
     3. Body/frame-hosted exhaust (Pattern C)
+
+    If ``intern`` is given (one dict per vehicle), structurally identical
+    results are replaced by the first instance seen, so engine variants
+    sharing a header chain share one ExhaustSlotInfo.
     """
     results: List[ExhaustSlotInfo] = []
 
@@ -336,19 +396,16 @@ def trace_exhaust_chain(
     engine_exhaust_slots = find_exhaust_slots_in_part(parsed_data, engine_part_name)
     all_engine_slots = find_all_child_slots(parsed_data, engine_part_name)
 
-    # Check direct exhaust slots (e.g., barstow_exhaust_v8 as sibling)
-    direct_exhaust_slots = [
-        (st, dv) for st, dv in engine_exhaust_slots
-        if 'exhaust' in st.lower() and 'header' not in st.lower()
-           and 'manifold' not in st.lower() and 'downpipe' not in st.lower()
-    ]
-
-    # Check header/manifold/downpipe slots
-    downstream_slots = [
-        (st, dv) for st, dv in engine_exhaust_slots
-        if 'header' in st.lower() or 'manifold' in st.lower()
-           or 'downpipe' in st.lower()
-    ]
+    # Split into direct exhaust slots (e.g., barstow_exhaust_v8 as sibling)
+    # and header/manifold/downpipe slots — one lower() per slot type
+    direct_exhaust_slots = []
+    downstream_slots = []
+    for st, dv in engine_exhaust_slots:
+        st_lower = st.lower()
+        if 'header' in st_lower or 'manifold' in st_lower or 'downpipe' in st_lower:
+            downstream_slots.append((st, dv))
+        elif 'exhaust' in st_lower:
+            direct_exhaust_slots.append((st, dv))
 
     # For each downstream component, check if IT hosts an exhaust slot
     for ds_type, ds_default in downstream_slots:
@@ -359,13 +416,12 @@ def trace_exhaust_chain(
             # Filter for actual exhaust (not another header/manifold)
             final_exhaust = [
                 (st, dv) for st, dv in ds_exhaust
-                if 'exhaust' in st.lower() and 'header' not in st.lower()
-                   and 'manifold' not in st.lower() and 'downpipe' not in st.lower()
+                if _is_final_exhaust(st.lower())
             ]
             # Extract downstream component nodes
             ds_nodes = _extract_part_nodes(parsed_data, ds_part)
-            node_names = [n['name'] for n in ds_nodes]
-            node_positions = [(n['x'], n['y'], n['z']) for n in ds_nodes]
+            node_names = tuple(n['name'] for n in ds_nodes)
+            node_positions = tuple((n['x'], n['y'], n['z']) for n in ds_nodes)
 
             if final_exhaust:
                 for exh_type, exh_default in final_exhaust:
@@ -382,7 +438,7 @@ def trace_exhaust_chain(
                 results.append(ExhaustSlotInfo(
                     downstream_component_name=ds_part,
                     downstream_component_slotType=ds_type,
-                    exhaust_slot_type="(none found)",
+                    exhaust_slot_type=_NONE_FOUND,
                     chain_path=f"{engine_part_name} → {ds_type}[{ds_part}] → ???",
                     node_names=node_names,
                     node_positions=node_positions
@@ -395,8 +451,8 @@ def trace_exhaust_chain(
             downstream_component_slotType=exh_type,
             exhaust_slot_type=exh_type,
             chain_path=f"{engine_part_name} → {exh_type} (sibling slot)",
-            node_names=[],
-            node_positions=[]
+            node_names=(),
+            node_positions=()
         ))
 
     # --- Phase 2: Intermediate-hosted (intake → header/downpipe → exhaust) ---
@@ -404,7 +460,7 @@ def trace_exhaust_chain(
         # No direct exhaust components — check intake/turbo slots
         non_exhaust_engine_slots = [
             (st, dv, desc) for st, dv, desc in all_engine_slots
-            if not EXHAUST_SLOT_PATTERNS.search(st)
+            if not _EXHAUST_SEARCH(st)
         ]
         for int_type, int_default, int_desc in non_exhaust_engine_slots:
             int_part = _find_part_by_slotType(parsed_data, int_type)
@@ -419,11 +475,12 @@ def trace_exhaust_chain(
                 if ie_part:
                     ie_child_exhaust = find_exhaust_slots_in_part(parsed_data, ie_part)
                     ie_nodes = _extract_part_nodes(parsed_data, ie_part)
-                    final = [
-                        (st, dv) for st, dv in ie_child_exhaust
-                        if 'exhaust' in st.lower() and 'header' not in st.lower()
-                           and 'downpipe' not in st.lower()
-                    ]
+                    final = []
+                    for st, dv in ie_child_exhaust:
+                        st_lower = st.lower()
+                        if ('exhaust' in st_lower and 'header' not in st_lower
+                                and 'downpipe' not in st_lower):
+                            final.append((st, dv))
                     if final:
                         for exh_type, exh_default in final:
                             results.append(ExhaustSlotInfo(
@@ -431,8 +488,8 @@ def trace_exhaust_chain(
                                 downstream_component_slotType=ie_type,
                                 exhaust_slot_type=exh_type,
                                 chain_path=f"{engine_part_name} → {int_type}[{int_part}] → {ie_type}[{ie_part}] → {exh_type}",
-                                node_names=[n['name'] for n in ie_nodes],
-                                node_positions=[(n['x'], n['y'], n['z']) for n in ie_nodes]
+                                node_names=tuple(n['name'] for n in ie_nodes),
+                                node_positions=tuple((n['x'], n['y'], n['z']) for n in ie_nodes)
                             ))
 
             # Also check for turbo variants of the same slot
@@ -459,10 +516,12 @@ def trace_exhaust_chain(
                                         downstream_component_slotType=ae_type,
                                         exhaust_slot_type=exh_type,
                                         chain_path=f"{engine_part_name} → {int_type}[{alt_part_name}] → {ae_type}[{ae_part}] → {exh_type}",
-                                        node_names=[n['name'] for n in ae_nodes],
-                                        node_positions=[(n['x'], n['y'], n['z']) for n in ae_nodes]
+                                        node_names=tuple(n['name'] for n in ae_nodes),
+                                        node_positions=tuple((n['x'], n['y'], n['z']) for n in ae_nodes)
                                     ))
 
+    if intern is not None:
+        results = [intern.setdefault(info, info) for info in results]
     return results
 
 
@@ -494,7 +553,8 @@ def _extract_part_nodes(
     for item in nodes_sections:
         if not isinstance(item, list) or len(item) < 4:
             continue
-        if isinstance(item[0], str) and item[0] in ('id', 'id1', 'id2'):
+        h = item[0]
+        if type(h) is str and h in _NODE_HEADER_KEYS:
             continue
 
         node_name = str(item[0]).rstrip(',').strip('"')
@@ -664,6 +724,8 @@ def profile_vehicle_exhausts(
 
     # Build merged data from ALL vehicle files for cross-file chain resolution
     merged_data = build_merged_vehicle_data(base_path, vehicle_name, engine_files, exhaust_files)
+    # Shared across engine variants so identical chains are allocated once
+    chain_intern: Dict[ExhaustSlotInfo, ExhaustSlotInfo] = {}
 
     for engine_file in engine_files:
         try:
@@ -705,7 +767,9 @@ def profile_vehicle_exhausts(
             ]
 
             # Use MERGED data for chain tracing (cross-file resolution)
-            exhaust_chains = trace_exhaust_chain(merged_data, part_name, str(engine_file), vehicle_name)
+            exhaust_chains = trace_exhaust_chain(
+                merged_data, part_name, str(engine_file), vehicle_name, chain_intern
+            )
 
             pattern = classify_pattern(exhaust_chains, base_path, vehicle_name, merged_data, part_name)
 
@@ -741,41 +805,36 @@ def classify_pattern(
       B  — engine → intake/turbo → header/downpipe → exhaust
       C  — body/frame hosts exhaust slot (decoupled from engine chain)
     """
-    body_exhaust = find_body_frame_exhaust_slots(base_path, vehicle_name)
-
-    if not chains:
-        # No exhaust chain from engine at all
-        if body_exhaust:
-            return "C (body/frame-hosted)"
-        return "no_exhaust"
-
     # Check if any chain actually found a real exhaust slot
     has_real_exhaust = any(
-        c.exhaust_slot_type != "(none found)" for c in chains
+        c.exhaust_slot_type != _NONE_FOUND for c in chains
     )
 
-    # If chains exist but none have a real exhaust child, check body/frame
-    if not has_real_exhaust and body_exhaust:
-        return "C (body/frame-hosted)"
+    # Only scan body/frame files when the engine chain can't settle it —
+    # a real exhaust child already rules out Pattern C.
+    if not has_real_exhaust:
+        if find_body_frame_exhaust_slots(base_path, vehicle_name):
+            return "C (body/frame-hosted)"
+        if not chains:
+            # No exhaust chain from engine at all
+            return "no_exhaust"
 
     for chain in chains:
-        path_lower = chain.chain_path.lower()
-        if 'sibling' in path_lower:
+        if chain.is_sibling:
             return "A' (engine sibling slots)"
-        if 'intake' in path_lower or 'turbo' in path_lower:
+        if chain.via_intake or chain.via_turbo:
             return "B (intake-nested)"
 
     # Check if there's also a sibling exhaust slot
     all_engine_slots = find_all_child_slots(parsed_data, engine_part)
-    has_sibling_exhaust = any(
-        'exhaust' in st.lower() and 'header' not in st.lower()
-        and 'manifold' not in st.lower()
-        for st, _, _ in all_engine_slots
-    )
-    has_header = any(
-        'header' in st.lower() or 'manifold' in st.lower()
-        for st, _, _ in all_engine_slots
-    )
+    has_sibling_exhaust = False
+    has_header = False
+    for st, _, _ in all_engine_slots:
+        st_lower = st.lower()
+        if 'header' in st_lower or 'manifold' in st_lower:
+            has_header = True
+        elif 'exhaust' in st_lower:
+            has_sibling_exhaust = True
 
     if has_sibling_exhaust and has_header:
         return "A' (engine sibling slots)"
@@ -818,153 +877,240 @@ def validate_camso_adapted_isExhaust(
 #   A' = engine has sibling exhaust slot (directly on engine, not through header)
 #   B  = engine → intake/turbo → header/downpipe → exhaust (nested chain)
 #   C  = body/frame hosts exhaust slot (decoupled from engine chain)
-EXPECTED = {
-    'pickup':   {'count': 2, 'pattern': 'A'},
-    'moonhawk': {'count': 1, 'pattern': "A'"},
-    'covet':    {'count': 1, 'pattern': 'B'},    # front engines: intake → header → exhaust
-    'fullsize': {'count': 2, 'pattern': 'C'},    # exhaust on frame, not engine chain
-    'vivace':   {'count': 1, 'pattern': 'C'},    # exhaust on body, not engine chain
-    'barstow':  {'count': 1, 'pattern': "A'"},   # parser limitation: may not parse
-}
+# (vehicle, expected engine-block isExhaust count, expected pattern)
+EXPECTED = (
+    ('pickup',   2, 'A'),
+    ('moonhawk', 1, "A'"),
+    ('covet',    1, 'B'),    # front engines: intake → header → exhaust
+    ('fullsize', 2, 'C'),    # exhaust on frame, not engine chain
+    ('vivace',   1, 'C'),    # exhaust on body, not engine chain
+    ('barstow',  1, "A'"),   # parser limitation: may not parse
+)
 
 
-def run_tests():
-    """Run the full exploration suite."""
-    base_path = Path(__file__).parent.parent / 'SteamLibrary_content_vehicles'
-    adapted_base = Path(__file__).parent.parent / 'mods' / 'unpacked'
+# Report separators
+_SEP72 = '─' * 72
+_SEP80 = '=' * 80
+_SUMMARY_RULE = f"{'─' * 12} {'─' * 30} {'─' * 35} {'─' * 15}"
 
-    if not base_path.exists():
-        print(f"ERROR: BeamNG vehicle data not found at {base_path}")
-        return False
 
-    print("=" * 80)
-    print("EXHAUST SOLVER — Phase 0 Exploration & Data Validation")
-    print("=" * 80)
+def _explore_vehicle(
+    base_path: Path,
+    vehicle: str,
+    exp_count: int,
+    exp_pattern: str
+) -> Dict[str, Any]:
+    """Explore and validate one vehicle.
 
-    vehicles = list(EXPECTED.keys())
-    all_good = True
-    results_summary = []
+    Safe to run in a worker thread: report lines are collected rather than
+    printed. Returns {'lines', 'ok', 'summary'} where summary is None when
+    no engine profiles were generated.
+    """
+    lines: List[str] = []
+    out = lines.append
+    ok = True
+
+    out("\n" + _SEP72)
+    out(f"Vehicle: {vehicle}")
+    out(_SEP72)
 
-    for vehicle in vehicles:
-        print(f"\n{'─' * 72}")
-        print(f"Vehicle: {vehicle}")
-        print(f"{'─' * 72}")
+    # Engine file discovery
+    engine_files = find_engine_files(base_path, vehicle)
+    out(f"  Engine files found: {len(engine_files)}")
+    lines.extend([f"    • {ef.name}" for ef in engine_files])
 
-        # Engine file discovery
-        engine_files = find_engine_files(base_path, vehicle)
-        print(f"  Engine files found: {len(engine_files)}")
-        for ef in engine_files:
-            print(f"    • {ef.name}")
+    if not engine_files:
+        # Nothing to profile — skip the exhaust/body scans and parsing
+        out(f"  ⚠ No engine files found, skipping")
+        return {
+            'lines': lines,
+            'ok': False,
+            'summary': {
+                'vehicle': vehicle,
+                'isExhaust': 'SKIP',
+                'pattern': 'SKIP',
+                'exhaust_found': 'SKIP',
+            },
+        }
 
-        # Exhaust file discovery
-        exhaust_files = find_exhaust_files(base_path, vehicle)
-        print(f"  Exhaust files found: {len(exhaust_files)}")
-        for ef in exhaust_files:
-            print(f"    • {ef.name}")
+    # Exhaust file discovery
+    exhaust_files = find_exhaust_files(base_path, vehicle)
+    out(f"  Exhaust files found: {len(exhaust_files)}")
+    lines.extend([f"    • {ef.name}" for ef in exhaust_files])
 
-        # Body/frame exhaust slots
+    # Body/frame exhaust slots — only Pattern C validation depends on them,
+    # so skip the scan for other vehicles unless DEBUG logging wants the report
+    if exp_pattern == 'C' or logging.getLogger().isEnabledFor(logging.DEBUG):
         body_exhaust = find_body_frame_exhaust_slots(base_path, vehicle)
-        if body_exhaust:
-            print(f"  Body/frame exhaust slots: {len(body_exhaust)}")
-            for src_file, part, slot_type in body_exhaust:
-                print(f"    • {src_file} → {part} → {slot_type}")
+    else:
+        body_exhaust = []
+    if body_exhaust:
+        out(f"  Body/frame exhaust slots: {len(body_exhaust)}")
+        for src_file, part, slot_type in body_exhaust:
+            out(f"    • {src_file} → {part} → {slot_type}")
+
+    # Profile each engine
+    profiles = profile_vehicle_exhausts(base_path, vehicle)
+
+    if not profiles:
+        out(f"  ⚠ No engine profiles generated")
+        return {'lines': lines, 'ok': False, 'summary': None}
+
+    for profile in profiles:
+        # Only validate primary engines with mainEngine
+        out(f"\n  Engine: {profile.engine_name} ({profile.engine_file})")
+        out(f"    isExhaust nodes: {profile.is_exhaust_count}")
+        for node in profile.is_exhaust_nodes:
+            out(f"      • {node.name} at ({node.x:.3f}, {node.y:.3f}, {node.z:.3f})  group: {node.group}")
+        out(f"    Pattern: {profile.pattern_classification}")
+
+        if profile.exhaust_slots:
+            out(f"    Exhaust chain(s):")
+            for chain in profile.exhaust_slots:
+                out(f"      • {chain.chain_path}")
+                out(f"        exhaust slotType: {chain.exhaust_slot_type}")
+                if chain.node_names:
+                    out(f"        bridge nodes: {', '.join(chain.node_names)}")
+        else:
+            out(f"    Exhaust chain(s): NONE FOUND")
+
+        for note in profile.notes:
+            out(f"    NOTE: {note}")
+
+    # Validation
+    # Find the primary engine profile — prefer engines with real exhaust chains
+    # or most isExhaust nodes. Skip parts with 0 isExhaust.
+    primary_candidates = [p for p in profiles if p.is_exhaust_count > 0]
+    if not primary_candidates:
+        primary_candidates = profiles  # fallback to all
+
+    # Prefer classified engines, then the most isExhaust nodes; first wins ties
+    primary = None
+    best_classified = False
+    best_count = -1
+    for p in primary_candidates:
+        classified = p.pattern_classification != 'no_exhaust'
+        count = p.is_exhaust_count
+        if classified > best_classified or (classified == best_classified and count > best_count):
+            primary = p
+            best_classified = classified
+            best_count = count
+    if primary:
+        primary_count = primary.is_exhaust_count
+        primary_pattern = primary.pattern_classification
+        ok_count = primary_count == exp_count
+        ok_pattern = exp_pattern in primary_pattern
+        status_count = "PASS" if ok_count else "FAIL"
+        status_pattern = "PASS" if ok_pattern else "FAIL"
+
+        # Check that we found an exhaust slot (unless no_exhaust)
+        has_exhaust = any(
+            c.exhaust_slot_type != _NONE_FOUND
+            for c in primary.exhaust_slots
+        )
+        if exp_pattern == 'C':
+            # For Pattern C, exhaust chain from engine might be empty
+            # But body/frame slots should exist
+            has_exhaust = has_exhaust or bool(body_exhaust)
+
+        ok_exhaust = has_exhaust
+        status_exhaust = "PASS" if ok_exhaust else "FAIL"
+
+        if not ok_count: ok = False
+        if not ok_pattern: ok = False
+        if not ok_exhaust: ok = False
+
+        summary = {
+            'vehicle': vehicle,
+            'isExhaust': f"{status_count} ({primary_count}, expected {exp_count})",
+            'pattern': f"{status_pattern} ({primary_pattern})",
+            'exhaust_found': status_exhaust,
+        }
+    else:
+        ok = False
+        summary = {
+            'vehicle': vehicle,
+            'isExhaust': 'SKIP',
+            'pattern': 'SKIP',
+            'exhaust_found': 'SKIP',
+        }
 
-        # Profile each engine
-        profiles = profile_vehicle_exhausts(base_path, vehicle)
+    return {'lines': lines, 'ok': ok, 'summary': summary}
 
-        if not profiles:
-            print(f"  ⚠ No engine profiles generated")
-            all_good = False
-            continue
 
-        expected = EXPECTED[vehicle]
-
-        for profile in profiles:
-            # Only validate primary engines with mainEngine
-            print(f"\n  Engine: {profile.engine_name} ({profile.engine_file})")
-            print(f"    isExhaust nodes: {profile.is_exhaust_count}")
-            for node in profile.is_exhaust_nodes:
-                print(f"      • {node.name} at ({node.x:.3f}, {node.y:.3f}, {node.z:.3f})  group: {node.group}")
-            print(f"    Pattern: {profile.pattern_classification}")
-
-            if profile.exhaust_slots:
-                print(f"    Exhaust chain(s):")
-                for chain in profile.exhaust_slots:
-                    print(f"      • {chain.chain_path}")
-                    print(f"        exhaust slotType: {chain.exhaust_slot_type}")
-                    if chain.node_names:
-                        print(f"        bridge nodes: {', '.join(chain.node_names)}")
-            else:
-                print(f"    Exhaust chain(s): NONE FOUND")
-
-            for note in profile.notes:
-                print(f"    NOTE: {note}")
-
-        # Validation
-        # Find the primary engine profile — prefer engines with real exhaust chains
-        # or most isExhaust nodes. Skip parts with 0 isExhaust.
-        primary_candidates = [p for p in profiles if p.is_exhaust_count > 0]
-        if not primary_candidates:
-            primary_candidates = profiles  # fallback to all
-
-        primary = max(
-            primary_candidates,
-            key=lambda p: (
-                p.pattern_classification != 'no_exhaust',   # prefer classified
-                p.is_exhaust_count,                          # then most isExhaust
-            )
-        ) if primary_candidates else None
-        if primary:
-            ok_count = primary.is_exhaust_count == expected['count']
-            ok_pattern = expected['pattern'] in primary.pattern_classification
-            status_count = "PASS" if ok_count else "FAIL"
-            status_pattern = "PASS" if ok_pattern else "FAIL"
-
-            # Check that we found an exhaust slot (unless no_exhaust)
-            has_exhaust = any(
-                c.exhaust_slot_type != "(none found)"
-                for c in primary.exhaust_slots
-            )
-            if expected['pattern'] == 'C':
-                # For Pattern C, exhaust chain from engine might be empty
-                # But body/frame slots should exist
-                has_exhaust = has_exhaust or bool(body_exhaust)
+def _emit(lines: List[str]) -> None:
+    """Write a block of report lines with a single stdout write.
+
+    With DEBUG logging enabled, lines are printed one at a time so they stay
+    interleaved with log output.
+    """
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        for line in lines:
+            print(line)
+        return
+    sys.stdout.write("\n".join(lines) + "\n")
 
-            ok_exhaust = has_exhaust
-            status_exhaust = "PASS" if ok_exhaust else "FAIL"
 
-            if not ok_count: all_good = False
-            if not ok_pattern: all_good = False
-            if not ok_exhaust: all_good = False
+_REPO_ROOT = Path(__file__).parent.parent
+_STEAM_BASE = _REPO_ROOT / 'SteamLibrary_content_vehicles'
+_ADAPTED_BASE = _REPO_ROOT / 'mods' / 'unpacked'
+_PICKUP_ADAPTED_DIR = _ADAPTED_BASE / 'engineswaps' / 'vehicles' / 'pickup'
 
-            results_summary.append({
-                'vehicle': vehicle,
-                'isExhaust': f"{status_count} ({primary.is_exhaust_count}, expected {expected['count']})",
-                'pattern': f"{status_pattern} ({primary.pattern_classification})",
-                'exhaust_found': status_exhaust,
-            })
-        else:
+
+def run_tests():
+    """Run the full exploration suite."""
+    base_path = _STEAM_BASE
+    adapted_base = _ADAPTED_BASE
+
+    if not base_path.exists():
+        print(f"ERROR: BeamNG vehicle data not found at {base_path}")
+        return False
+
+    print(_SEP80)
+    print("EXHAUST SOLVER — Phase 0 Exploration & Data Validation")
+    print(_SEP80)
+
+    all_good = True
+    results_summary = []
+
+    # Vehicles are independent (file discovery + parsing), so explore them
+    # concurrently and report in EXPECTED order once all have finished.
+    with ThreadPoolExecutor(max_workers=len(EXPECTED)) as ex:
+        futures = {
+            ex.submit(_explore_vehicle, base_path, vehicle, exp_count, exp_pattern): vehicle
+            for vehicle, exp_count, exp_pattern in EXPECTED
+        }
+        explored = {}
+        for fut in as_completed(futures):
+            explored[futures[fut]] = fut.result()
+
+    for vehicle, _, _ in EXPECTED:
+        result = explored[vehicle]
+        _emit(result['lines'])
+        if not result['ok']:
             all_good = False
-            results_summary.append({
-                'vehicle': vehicle,
-                'isExhaust': 'SKIP',
-                'pattern': 'SKIP',
-                'exhaust_found': 'SKIP',
-            })
+        if result['summary'] is not None:
+            results_summary.append(result['summary'])
 
     # --- Camso adapted engine validation ---
-    print(f"\n{'─' * 72}")
+    print("\n" + _SEP72)
     print("Camso Adapted Engine — isExhaust Preservation Check")
-    print(f"{'─' * 72}")
+    print(_SEP72)
 
-    adapted_files = list((adapted_base / 'engineswaps' / 'vehicles' / 'pickup').glob("*engine*adapted*.jbeam"))
+    adapted_files = list(_PICKUP_ADAPTED_DIR.glob("*engine*adapted*.jbeam"))
     if not adapted_files:
         # Try other locations
         for mod_dir in adapted_base.iterdir():
-            if mod_dir.is_dir() and 'engineswaps' not in mod_dir.name:
-                for f in mod_dir.rglob("*engine*adapted*.jbeam"):
-                    adapted_files.append(f)
-                    break  # one per mod is enough
+            # Name check first: it avoids a stat() for the engineswaps dir
+            if 'engineswaps' not in mod_dir.name and mod_dir.is_dir():
+                # iglob walks with plain strings (no Path per directory) and
+                # is lazy, so the walk stops at the first hit
+                match = next(glob.iglob(
+                    os.path.join(str(mod_dir), '**', '*engine*adapted*.jbeam'),
+                    recursive=True, include_hidden=True,
+                ), None)
+                if match is not None:
+                    adapted_files.append(Path(match))  # one per mod is enough
 
     if adapted_files:
         for af in adapted_files[:3]:  # Check up to 3
@@ -979,18 +1125,21 @@ def run_tests():
         print("  SKIP  No adapted engine files found")
 
     # --- Summary ---
-    print(f"\n{'=' * 80}")
-    print("SUMMARY")
-    print(f"{'=' * 80}")
-    print(f"{'Vehicle':<12} {'isExhaust Count':<30} {'Pattern':<35} {'Exhaust Found':<15}")
-    print(f"{'─'*12} {'─'*30} {'─'*35} {'─'*15}")
+    out = [
+        "\n" + _SEP80,
+        "SUMMARY",
+        _SEP80,
+        f"{'Vehicle':<12} {'isExhaust Count':<30} {'Pattern':<35} {'Exhaust Found':<15}",
+        _SUMMARY_RULE,
+    ]
     for r in results_summary:
-        print(f"{r['vehicle']:<12} {r['isExhaust']:<30} {r['pattern']:<35} {r['exhaust_found']:<15}")
+        out.append(f"{r['vehicle']:<12} {r['isExhaust']:<30} {r['pattern']:<35} {r['exhaust_found']:<15}")
 
-    print(f"\n{'─' * 72}")
     overall = "ALL PASS" if all_good else "SOME FAILURES"
-    print(f"Overall: {overall}")
-    print(f"{'─' * 72}")
+    out.append("\n" + _SEP72)
+    out.append(f"Overall: {overall}")
+    out.append(_SEP72)
+    _emit(out)
 
     return all_good
 
@@ -19,28 +19,50 @@ Known transverse BeamNG targets:
   covet (front engines), vivace (all), sunburst2 (all)
 """
 
+import importlib
+import importlib.util
 import json
 import os
 import shutil
 import sys
 import tempfile
 import unittest
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from engineswap import (
-    EngineTransplantUtility,
-    JBeamParser,
-    VehicleAnalyzer,
-    EXHAUST_SOLVER_AVAILABLE,
-    TMS_AVAILABLE,
-)
+from _jbeam_cache import cached_parse, file_mtime_ns
 
 BASE = Path(__file__).resolve().parent.parent
 STEAM_BASE = BASE / 'SteamLibrary_content_vehicles'
 MOD_BASE = BASE / 'mods' / 'unpacked'
 
+# engineswap is expensive to import and every class here is skipped without
+# game data, so only probe for exhaust_solver at import time and load
+# engineswap from setUpClass (see _import_engineswap).
+EXHAUST_SOLVER_AVAILABLE = importlib.util.find_spec('exhaust_solver') is not None
+
+EngineTransplantUtility = None
+JBeamParser = None
+VehicleAnalyzer = None
+
+
+def _import_engineswap() -> None:
+    """Import engineswap on first use and bind the names tests rely on."""
+    global EXHAUST_SOLVER_AVAILABLE
+    if EngineTransplantUtility is not None:
+        return
+    engineswap = importlib.import_module('engineswap')
+    globals().update(
+        EngineTransplantUtility=engineswap.EngineTransplantUtility,
+        JBeamParser=engineswap.JBeamParser,
+        VehicleAnalyzer=engineswap.VehicleAnalyzer,
+    )
+    # The probe only finds the file; engineswap knows if it actually imported.
+    # setUpClass re-checks this, as the skipUnless decorators saw the probe.
+    EXHAUST_SOLVER_AVAILABLE = engineswap.EXHAUST_SOLVER_AVAILABLE
+
 # --------------------------------------------------------------------------
 # Donor engine catalog (longitudinal Camso engines known to work)
 # --------------------------------------------------------------------------
@@ -52,7 +74,7 @@ DONOR_66a66 = MOD_BASE / 'camsonav6' / 'vehicles' / 'dualexhaust_manualtrans' /
 # Helpers
 # --------------------------------------------------------------------------
 
-def _create_utility(tmp_dir: Path) -> EngineTransplantUtility:
+def _create_utility(tmp_dir: Path) -> 'EngineTransplantUtility':
     """Create utility instance with temporary output directory."""
     return EngineTransplantUtility(
         base_vehicles_path=STEAM_BASE,
@@ -61,15 +83,50 @@ def _create_utility(tmp_dir: Path) -> EngineTransplantUtility:
     )
 
 
-def _run_pipeline(utility: EngineTransplantUtility, donor_path: Path, target_name: str):
+@lru_cache(maxsize=16)
+def _cached_donor_engine(path_str: str, mtime_ns: int):
+    """Donor EngineCharacteristics, mirroring load_donor_engine() on a cached parse."""
+    jbeam_data = cached_parse(path_str, mtime_ns)
+    if not jbeam_data:
+        return None
+    return JBeamParser.extract_engine_characteristics(jbeam_data)
+
+
+@lru_cache(maxsize=16)
+def _cached_vehicle(target_name: str, mtime_ns: int):
+    """Target VehicleInfo, keyed on the vehicle directory mtime."""
+    try:
+        return VehicleAnalyzer(STEAM_BASE).analyze_vehicle(target_name)
+    except Exception:
+        return None
+
+
+def _run_pipeline(test_cls, donor_path: Path, target_name: str):
     """Run the full adaptation pipeline for a donor → target pair.
 
-    Returns (output_path, adapted_data, exhaust_result) or raises.
+    Uses test_cls.utility and memoizes into test_cls._results, both set up
+    in setUpClass, so a result never outlives the class workspace its output
+    file lives in. Donor and target analysis are cached module-wide (keyed
+    on file mtime); tests only read the returned objects.
+
+    Returns (output_path, adapted_data, exhaust_result, part_dicts) or raises.
+    part_dicts holds the adapted output's part entries (dict values only).
     """
-    engine = utility.load_donor_engine(donor_path)
+    key = (donor_path, target_name)
+    result = test_cls._results.get(key)
+    if result is None:
+        result = test_cls._results[key] = _run_pipeline_uncached(
+            test_cls.utility, donor_path, target_name
+        )
+    return result
+
+
+def _run_pipeline_uncached(utility: 'EngineTransplantUtility', donor_path: Path, target_name: str):
+    """Run the pipeline in utility's workspace without consulting any class memo."""
+    engine = _cached_donor_engine(str(donor_path), file_mtime_ns(donor_path))
     if engine is None:
         raise RuntimeError(f"Failed to load donor engine: {donor_path}")
-    vehicle = utility.analyze_target_vehicle(target_name)
+    vehicle = _cached_vehicle(target_name, file_mtime_ns(STEAM_BASE / target_name))
     if vehicle is None:
         raise RuntimeError(f"Failed to analyze vehicle: {target_name}")
     plan = utility.generate_adaptation_plan(engine, vehicle)
@@ -78,10 +135,15 @@ def _run_pipeline(utility: EngineTransplantUtility, donor_path: Path, target_nam
     # Parse output file for inspection
     adapted_data = None
     if output_file and output_file.exists():
-        adapted_data = JBeamParser.parse_jbeam(output_file)
+        adapted_data = cached_parse(str(output_file), output_file.stat().st_mtime_ns)
+
+    # Part entries only (top-level non-dict values are metadata), filtered once
+    part_dicts = {}
+    if adapted_data:
+        part_dicts = {k: v for k, v in adapted_data.items() if isinstance(v, dict)}
 
     exhaust_result = utility._last_exhaust_result
-    return output_file, adapted_data, exhaust_result
+    return output_file, adapted_data, exhaust_result, part_dicts
 
 
 # ==========================================================================
@@ -93,65 +155,67 @@ def _run_pipeline(utility: EngineTransplantUtility, donor_path: Path, target_nam
 class TestExhaustIntegrationPickup(unittest.TestCase):
     """Pickup: 2 isExhaust nodes, Pattern A — matching strategy expected."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
-        self.utility = _create_utility(self.tmp)
+    @classmethod
+    def setUpClass(cls):
+        _import_engineswap()
+        if not EXHAUST_SOLVER_AVAILABLE:
+            raise unittest.SkipTest("exhaust_solver not available")
+        cls.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
+        cls.utility = _create_utility(cls.tmp)
+        cls._results = {}
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
 
     @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
-    def test_pickup_has_exhaust_component(self):
-        """Adapted jbeam for pickup should contain exhaust_adapter part."""
-        output, data, exh = _run_pipeline(self.utility, DONOR_3813e, "pickup")
+    def test_pickup_all(self):
+        """Pickup swap: exhaust component, engine slot entry and result metadata.
+
+        One pipeline run; each aspect reports independently via subTest.
+        """
+        output, data, exh, part_dicts = _run_pipeline(type(self), DONOR_3813e, "pickup")
         self.assertIsNotNone(output, "generate_adapted_jbeam returned None")
         self.assertIsNotNone(data, "Could not parse output file")
         self.assertIsNotNone(exh, "Exhaust solver did not run")
 
-        # Check strategy
-        self.assertIn(exh.strategy, ("matching", "mismatch"))
-
-        # Check adapted_part was injected
-        component_key = "pickup_exhaust_adapter"
-        self.assertIn(component_key, data,
-                       f"Adapted exhaust component not in output. Keys: {list(data.keys())}")
-
-        # Verify component structure
-        comp = data[component_key]
-        self.assertIn('nodes', comp)
-        self.assertIn('beams', comp)
-        self.assertIn('slots', comp)
-
-    @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
-    def test_pickup_exhaust_slot_in_engine(self):
-        """Engine slots should include exhaust_adapter slot entry."""
-        output, data, exh = _run_pipeline(self.utility, DONOR_3813e, "pickup")
-        self.assertIsNotNone(data)
-
-        # Find the primary engine part (has slotType matching pickup_engine)
-        engine_part = None
-        for pname, pdata in data.items():
-            if isinstance(pdata, dict) and 'pickup' in pdata.get('slotType', '').lower():
-                engine_part = pdata
-                break
-        self.assertIsNotNone(engine_part, "Primary engine part not found")
-
-        # Check for exhaust adapter slot entry in engine's slots
-        all_slots = engine_part.get('slots', [])
-        exhaust_slots = [s for s in all_slots
-                         if isinstance(s, list) and len(s) > 0
-                         and 'exhaust_adapter' in str(s[0]).lower()]
-        self.assertGreater(len(exhaust_slots), 0,
-                           f"No exhaust_adapter slot in engine slots: {all_slots}")
-
-    @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
-    def test_pickup_exhaust_result_metadata(self):
-        """ExhaustSolverResult should have correct metadata for pickup."""
-        _, _, exh = _run_pipeline(self.utility, DONOR_3813e, "pickup")
-        self.assertIsNotNone(exh)
-        self.assertGreater(exh.donor_isExhaust_count, 0)
-        self.assertIsNotNone(exh.target_exhaust_slot_type)
-        self.assertIn("pickup", exh.target_exhaust_slot_type.lower())
+        with self.subTest("component"):
+            # Adapted jbeam for pickup should contain exhaust_adapter part
+            self.assertIn(exh.strategy, ("matching", "mismatch"))
+
+            component_key = "pickup_exhaust_adapter"
+            self.assertIn(component_key, data,
+                           f"Adapted exhaust component not in output. Keys: {list(data.keys())}")
+
+            # Verify component structure
+            comp = part_dicts.get(component_key, {})
+            self.assertFalse({'nodes', 'beams', 'slots'}.difference(comp),
+                             "Adapter component missing nodes/beams/slots")
+
+        with self.subTest("slot_entry"):
+            # Engine slots should include exhaust_adapter slot entry.
+            # Find the primary engine part (has slotType matching pickup_engine)
+            engine_part = None
+            for pdata in part_dicts.values():
+                if 'pickup' in pdata.get('slotType', '').lower():
+                    engine_part = pdata
+                    break
+            self.assertIsNotNone(engine_part, "Primary engine part not found")
+
+            all_slots = engine_part.get('slots', [])
+            has_exhaust_slot = any(
+                isinstance(s, list) and s
+                and 'exhaust_adapter' in (s[0] if type(s[0]) is str else str(s[0])).lower()
+                for s in all_slots
+            )
+            self.assertTrue(has_exhaust_slot,
+                            f"No exhaust_adapter slot in engine slots: {all_slots}")
+
+        with self.subTest("metadata"):
+            # ExhaustSolverResult should have correct metadata for pickup
+            self.assertGreater(exh.donor_isExhaust_count, 0)
+            self.assertIsNotNone(exh.target_exhaust_slot_type)
+            self.assertIn("pickup", exh.target_exhaust_slot_type.lower())
 
 
 @unittest.skipUnless(EXHAUST_SOLVER_AVAILABLE, "exhaust_solver not available")
@@ -159,29 +223,33 @@ class TestExhaustIntegrationPickup(unittest.TestCase):
 class TestExhaustIntegrationMoonhawk(unittest.TestCase):
     """Moonhawk: 1 isExhaust, Pattern A' — may or may not produce component."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
-        self.utility = _create_utility(self.tmp)
+    @classmethod
+    def setUpClass(cls):
+        _import_engineswap()
+        if not EXHAUST_SOLVER_AVAILABLE:
+            raise unittest.SkipTest("exhaust_solver not available")
+        cls.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
+        cls.utility = _create_utility(cls.tmp)
+        cls._results = {}
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
 
     @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
-    def test_moonhawk_exhaust_solver_runs(self):
-        """Exhaust solver should execute for moonhawk swap."""
-        output, data, exh = _run_pipeline(self.utility, DONOR_3813e, "moonhawk")
-        self.assertIsNotNone(output, "generate_adapted_jbeam returned None")
+    def test_moonhawk_all(self):
+        """Moonhawk swap: solver runs; A' component may be None (sibling-only header)."""
+        output, data, exh, _ = _run_pipeline(type(self), DONOR_3813e, "moonhawk")
         self.assertIsNotNone(exh, "Exhaust solver did not run")
-        self.assertIn(exh.strategy, ("matching", "mismatch", "no_exhaust"))
 
-    @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
-    def test_moonhawk_component_or_none(self):
-        """Moonhawk A' pattern: component may be None (sibling-only header)."""
-        _, data, exh = _run_pipeline(self.utility, DONOR_3813e, "moonhawk")
-        self.assertIsNotNone(exh)
-        # A' pattern can produce adapted_part=None (known limitation)
-        if exh.adapted_part is not None:
-            self.assertIn("moonhawk_exhaust_adapter", data)
+        with self.subTest("solver_runs"):
+            self.assertIsNotNone(output, "generate_adapted_jbeam returned None")
+            self.assertIn(exh.strategy, ("matching", "mismatch", "no_exhaust"))
+
+        with self.subTest("component_or_none"):
+            # A' pattern can produce adapted_part=None (known limitation)
+            if exh.adapted_part is not None:
+                self.assertIn("moonhawk_exhaust_adapter", data)
 
 
 @unittest.skipUnless(EXHAUST_SOLVER_AVAILABLE, "exhaust_solver not available")
@@ -189,17 +257,23 @@ class TestExhaustIntegrationMoonhawk(unittest.TestCase):
 class TestExhaustIntegrationBarstow(unittest.TestCase):
     """Barstow: 1 isExhaust, Pattern A' — should produce component."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
-        self.utility = _create_utility(self.tmp)
+    @classmethod
+    def setUpClass(cls):
+        _import_engineswap()
+        if not EXHAUST_SOLVER_AVAILABLE:
+            raise unittest.SkipTest("exhaust_solver not available")
+        cls.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
+        cls.utility = _create_utility(cls.tmp)
+        cls._results = {}
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
 
     @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
     def test_barstow_exhaust_solver_runs(self):
         """Exhaust solver should execute for barstow swap."""
-        output, data, exh = _run_pipeline(self.utility, DONOR_3813e, "barstow")
+        output, data, exh, _ = _run_pipeline(type(self), DONOR_3813e, "barstow")
         self.assertIsNotNone(output)
         self.assertIsNotNone(exh)
         self.assertIn(exh.strategy, ("matching", "mismatch"))
@@ -210,17 +284,23 @@ class TestExhaustIntegrationBarstow(unittest.TestCase):
 class TestExhaustIntegrationMultiDonor(unittest.TestCase):
     """Test with different donor engines to verify consistency."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
-        self.utility = _create_utility(self.tmp)
+    @classmethod
+    def setUpClass(cls):
+        _import_engineswap()
+        if not EXHAUST_SOLVER_AVAILABLE:
+            raise unittest.SkipTest("exhaust_solver not available")
+        cls.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
+        cls.utility = _create_utility(cls.tmp)
+        cls._results = {}
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
 
     @unittest.skipUnless(DONOR_66a66.exists(), "Donor 66a66 not found")
     def test_dual_exhaust_donor_pickup(self):
         """Dual-exhaust Camso V6 (camsonav6, 036a5 gearbox-isExhaust) → pickup."""
-        output, data, exh = _run_pipeline(self.utility, DONOR_66a66, "pickup")
+        output, data, exh, _ = _run_pipeline(type(self), DONOR_66a66, "pickup")
         self.assertIsNotNone(output)
         self.assertIsNotNone(exh)
         # camsonav6 had gearbox isExhaust — promotion should make donor count > 0
@@ -233,17 +313,23 @@ class TestExhaustIntegrationMultiDonor(unittest.TestCase):
 class TestExhaustIntegrationNoExhaust(unittest.TestCase):
     """Vehicles with no standard exhaust (Pattern C/no_exhaust)."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
-        self.utility = _create_utility(self.tmp)
+    @classmethod
+    def setUpClass(cls):
+        _import_engineswap()
+        if not EXHAUST_SOLVER_AVAILABLE:
+            raise unittest.SkipTest("exhaust_solver not available")
+        cls.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
+        cls.utility = _create_utility(cls.tmp)
+        cls._results = {}
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
 
     @unittest.skipUnless(DONOR_3813e.exists(), "Donor 3813e not found")
     def test_vivace_pattern_c(self):
         """Vivace Pattern C (body-mounted exhaust) — solver should handle gracefully."""
-        output, data, exh = _run_pipeline(self.utility, DONOR_3813e, "vivace")
+        output, data, exh, _ = _run_pipeline(type(self), DONOR_3813e, "vivace")
         # Vivace is known transverse — may fail on orientation mismatch
         # If output is None, this is an expected orientation mismatch
         if output is not None and exh is not None:
@@ -256,12 +342,17 @@ class TestExhaustIntegrationNoExhaust(unittest.TestCase):
 class TestExhaustExtractFromAdapted(unittest.TestCase):
     """Unit-level tests for _extract_isExhaust_from_adapted helper."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
-        self.utility = _create_utility(self.tmp)
+    @classmethod
+    def setUpClass(cls):
+        _import_engineswap()
+        if not EXHAUST_SOLVER_AVAILABLE:
+            raise unittest.SkipTest("exhaust_solver not available")
+        cls.tmp = Path(tempfile.mkdtemp(prefix="exh_integ_"))
+        cls.utility = _create_utility(cls.tmp)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp, ignore_errors=True)
 
     def test_extract_from_mock_adapted(self):
         """Extract isExhaust from a synthetic adapted engine part dict."""
@@ -328,6 +419,12 @@ class TestExhaustExtractFromAdapted(unittest.TestCase):
         self.assertEqual(nodes[0].name, 'e2r')
 
 
+def tearDownModule():
+    cached_parse.cache_clear()
+    _cached_donor_engine.cache_clear()
+    _cached_vehicle.cache_clear()
+
+
 # ==========================================================================
 # Run
 # ==========================================================================
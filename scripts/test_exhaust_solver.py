@@ -23,6 +23,9 @@ Tests cover:
   - Integration: strategy + component generation with real vehicle data
 """
 
+import copy
+import functools
+import os
 import sys
 import unittest
 from pathlib import Path
@@ -33,6 +36,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from exhaust_solver import (
     # Data classes
     IsExhaustNode, ExhaustSlotInfo, EngineExhaustProfile, ExhaustSolverResult,
+    ChainKind,
     # Slot helpers
     _get_combined_slots, _is_slot_header, _extract_slot_fields,
     # Node extraction
@@ -63,182 +67,226 @@ BASE = Path(__file__).resolve().parent.parent
 STEAM_BASE = BASE / 'SteamLibrary_content_vehicles'
 MOD_BASE = BASE / 'mods' / 'unpacked' / 'engineswaps' / 'vehicles'
 
+# Placeholder base_path for unit tests that work on in-memory mock data
+_DOT = Path(".")
+
 
 # =========================================================================
 # Mock Data Builders
 # =========================================================================
 
+# Fixtures are built once at import and shared by every test; the solver
+# functions under test only read them. Tests that modify a fixture must
+# copy.deepcopy() it first.
+
+# Pattern A: engine → header → exhaust.
+_MOCK_ENGINE_WITH_HEADER_AND_EXHAUST: Dict[str, Any] = {
+    "test_engine_v8": {
+        "slotType": "test_engine",
+        "mainEngine": {},
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            {"group": "engine_block"},
+            ["e2r", 0.2, -1.0, 0.3, {"isExhaust": "mainEngine"}],
+            ["e2l", -0.2, -1.0, 0.3, {"isExhaust": "mainEngine"}],
+            ["e1r", 0.2, -1.5, 0.3],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_header", "test_header_v8", "Header"],
+        ],
+    },
+    "test_header_v8": {
+        "slotType": "test_header",
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            ["exm1r", 0.3, -0.8, 0.1],
+            ["exm1l", -0.3, -0.8, 0.1],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_exhaust_v8", "test_exhaust_stock", "Exhaust"],
+        ],
+    },
+}
+
+
+# Pattern A': engine has exhaust as sibling (header is leaf).
+_MOCK_ENGINE_WITH_SIBLING_EXHAUST: Dict[str, Any] = {
+    "test_engine_i6": {
+        "slotType": "test_engine",
+        "mainEngine": {},
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            {"group": "engine_block"},
+            ["e4r", 0.2, -1.0, 0.5, {"isExhaust": "mainEngine"}],
+            ["e1r", 0.2, -1.5, 0.3],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_header", "test_header_i6", "Header"],
+            ["test_exhaust_i6", "test_exhaust_stock", "Exhaust"],
+        ],
+    },
+    "test_header_i6": {
+        "slotType": "test_header",
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            ["exm1r", 0.3, -0.9, 0.1],
+        ],
+        # No exhaust child slot — header is leaf node
+    },
+}
+
+
+# Pattern B: engine → intake → header → exhaust.
+_MOCK_ENGINE_INTAKE_NESTED: Dict[str, Any] = {
+    "test_engine_sohc": {
+        "slotType": "test_engine",
+        "mainEngine": {},
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            {"group": "engine_block"},
+            ["e3r", 0.2, -1.0, 0.4, {"isExhaust": "mainEngine"}],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_intake", "test_intake_sohc", "Intake"],
+        ],
+    },
+    "test_intake_sohc": {
+        "slotType": "test_intake",
+        "slots": [
+            ["type", "default", "description"],
+            ["test_header_sohc", "test_exhmanifold_sohc", "Header"],
+        ],
+    },
+    "test_exhmanifold_sohc": {
+        "slotType": "test_header_sohc",
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            ["exm1r", 0.3, -0.7, 0.15],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_exhaust", "test_exhaust_stock", "Exhaust"],
+        ],
+    },
+}
+
+
+# Pattern C: body/frame hosts exhaust, engine chain is leaf.
+_MOCK_BODY_FRAME_EXHAUST: Dict[str, Any] = {
+    "test_engine_turbo": {
+        "slotType": "test_engine",
+        "mainEngine": {},
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            {"group": "engine_block"},
+            ["e3l", -0.2, -1.0, 0.4, {"isExhaust": "mainEngine"}],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_header", "test_header_turbo", "Header"],
+        ],
+    },
+    "test_header_turbo": {
+        "slotType": "test_header",
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            ["exm1r", 0.3, -0.8, 0.1],
+        ],
+        # Leaf node — no exhaust child
+    },
+    "test_body": {
+        "slotType": "test_body",
+        "slots": [
+            ["type", "default", "description"],
+            ["test_engine", "test_engine_turbo", "Engine"],
+            ["test_exhaust", "test_exhaust_stock", "Exhaust"],
+        ],
+    },
+}
+
+
+# Modern slots2 format.
+_MOCK_ENGINE_SLOTS2: Dict[str, Any] = {
+    "test_engine_modern": {
+        "slotType": "test_engine",
+        "mainEngine": {},
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            {"group": "engine_block"},
+            ["e3l", -0.2, -1.0, 0.4, {"isExhaust": "mainEngine"}],
+        ],
+        "slots2": [
+            ["type", ["allowTypes"], ["denyTypes"], "default", "description"],
+            ["test_header", ["test_header"], [], "test_header_mod", "Header"],
+        ],
+    },
+}
+
+
+# Engine with no exhaust system (electric or stripped).
+_MOCK_ENGINE_NO_EXHAUST: Dict[str, Any] = {
+    "test_engine_electric": {
+        "slotType": "test_engine",
+        "mainEngine": {},
+        "nodes": [
+            ["id", "posX", "posY", "posZ"],
+            {"group": "engine_block"},
+            ["e1l", -0.2, -1.5, 0.3],
+            ["e1r", 0.2, -1.5, 0.3],
+        ],
+        "slots": [
+            ["type", "default", "description"],
+            ["test_motor_controller", "test_mc_default", "Motor Controller"],
+        ],
+    },
+}
+
+
+# Pattern A merged data with beams on the header, for beam property
+# extraction in component generation tests. Built once; callers that need
+# to modify it must deepcopy first.
+_MOCK_MERGED_A_WITH_BEAMS: Dict[str, Any] = copy.deepcopy(_MOCK_ENGINE_WITH_HEADER_AND_EXHAUST)
+_MOCK_MERGED_A_WITH_BEAMS["test_header_v8"]["beams"] = [
+    ["id1:", "id2:"],
+    {"beamSpring": 11163370, "beamDamp": 130.43,
+     "beamDeform": 90000, "beamStrength": "FLT_MAX"},
+    ["exm1r", "e2r", {"isExhaust": "mainEngine"}],
+    ["exm1l", "e2l", {"isExhaust": "mainEngine"}],
+]
+
+
 def _mock_engine_with_header_and_exhaust() -> Dict[str, Any]:
     """Pattern A: engine → header → exhaust."""
-    return {
-        "test_engine_v8": {
-            "slotType": "test_engine",
-            "mainEngine": {},
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                {"group": "engine_block"},
-                ["e2r", 0.2, -1.0, 0.3, {"isExhaust": "mainEngine"}],
-                ["e2l", -0.2, -1.0, 0.3, {"isExhaust": "mainEngine"}],
-                ["e1r", 0.2, -1.5, 0.3],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_header", "test_header_v8", "Header"],
-            ],
-        },
-        "test_header_v8": {
-            "slotType": "test_header",
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                ["exm1r", 0.3, -0.8, 0.1],
-                ["exm1l", -0.3, -0.8, 0.1],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_exhaust_v8", "test_exhaust_stock", "Exhaust"],
-            ],
-        },
-    }
+    return _MOCK_ENGINE_WITH_HEADER_AND_EXHAUST
 
 
 def _mock_engine_with_sibling_exhaust() -> Dict[str, Any]:
     """Pattern A': engine has exhaust as sibling (header is leaf)."""
-    return {
-        "test_engine_i6": {
-            "slotType": "test_engine",
-            "mainEngine": {},
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                {"group": "engine_block"},
-                ["e4r", 0.2, -1.0, 0.5, {"isExhaust": "mainEngine"}],
-                ["e1r", 0.2, -1.5, 0.3],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_header", "test_header_i6", "Header"],
-                ["test_exhaust_i6", "test_exhaust_stock", "Exhaust"],
-            ],
-        },
-        "test_header_i6": {
-            "slotType": "test_header",
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                ["exm1r", 0.3, -0.9, 0.1],
-            ],
-            # No exhaust child slot — header is leaf node
-        },
-    }
+    return _MOCK_ENGINE_WITH_SIBLING_EXHAUST
 
 
 def _mock_engine_intake_nested() -> Dict[str, Any]:
     """Pattern B: engine → intake → header → exhaust."""
-    return {
-        "test_engine_sohc": {
-            "slotType": "test_engine",
-            "mainEngine": {},
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                {"group": "engine_block"},
-                ["e3r", 0.2, -1.0, 0.4, {"isExhaust": "mainEngine"}],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_intake", "test_intake_sohc", "Intake"],
-            ],
-        },
-        "test_intake_sohc": {
-            "slotType": "test_intake",
-            "slots": [
-                ["type", "default", "description"],
-                ["test_header_sohc", "test_exhmanifold_sohc", "Header"],
-            ],
-        },
-        "test_exhmanifold_sohc": {
-            "slotType": "test_header_sohc",
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                ["exm1r", 0.3, -0.7, 0.15],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_exhaust", "test_exhaust_stock", "Exhaust"],
-            ],
-        },
-    }
+    return _MOCK_ENGINE_INTAKE_NESTED
 
 
 def _mock_body_frame_exhaust() -> Dict[str, Any]:
     """Pattern C: body/frame hosts exhaust, engine chain is leaf."""
-    return {
-        "test_engine_turbo": {
-            "slotType": "test_engine",
-            "mainEngine": {},
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                {"group": "engine_block"},
-                ["e3l", -0.2, -1.0, 0.4, {"isExhaust": "mainEngine"}],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_header", "test_header_turbo", "Header"],
-            ],
-        },
-        "test_header_turbo": {
-            "slotType": "test_header",
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                ["exm1r", 0.3, -0.8, 0.1],
-            ],
-            # Leaf node — no exhaust child
-        },
-        "test_body": {
-            "slotType": "test_body",
-            "slots": [
-                ["type", "default", "description"],
-                ["test_engine", "test_engine_turbo", "Engine"],
-                ["test_exhaust", "test_exhaust_stock", "Exhaust"],
-            ],
-        },
-    }
+    return _MOCK_BODY_FRAME_EXHAUST
 
 
 def _mock_engine_slots2() -> Dict[str, Any]:
     """Modern slots2 format."""
-    return {
-        "test_engine_modern": {
-            "slotType": "test_engine",
-            "mainEngine": {},
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                {"group": "engine_block"},
-                ["e3l", -0.2, -1.0, 0.4, {"isExhaust": "mainEngine"}],
-            ],
-            "slots2": [
-                ["type", ["allowTypes"], ["denyTypes"], "default", "description"],
-                ["test_header", ["test_header"], [], "test_header_mod", "Header"],
-            ],
-        },
-    }
+    return _MOCK_ENGINE_SLOTS2
 
 
 def _mock_engine_no_exhaust() -> Dict[str, Any]:
     """Engine with no exhaust system (electric or stripped)."""
-    return {
-        "test_engine_electric": {
-            "slotType": "test_engine",
-            "mainEngine": {},
-            "nodes": [
-                ["id", "posX", "posY", "posZ"],
-                {"group": "engine_block"},
-                ["e1l", -0.2, -1.5, 0.3],
-                ["e1r", 0.2, -1.5, 0.3],
-            ],
-            "slots": [
-                ["type", "default", "description"],
-                ["test_motor_controller", "test_mc_default", "Motor Controller"],
-            ],
-        },
-    }
+    return _MOCK_ENGINE_NO_EXHAUST
 
 
 # =========================================================================
@@ -309,8 +357,7 @@ class TestNodeExtraction(unittest.TestCase):
         self.assertIn("test_engine_v8", result)
         nodes = result["test_engine_v8"]
         self.assertEqual(len(nodes), 2)
-        names = {n.name for n in nodes}
-        self.assertEqual(names, {"e2r", "e2l"})
+        self.assertEqual(sorted(n.name for n in nodes), ["e2l", "e2r"])
 
     def test_extract_pattern_a_group(self):
         data = _mock_engine_with_header_and_exhaust()
@@ -334,8 +381,7 @@ class TestNodeExtraction(unittest.TestCase):
         data = _mock_engine_with_header_and_exhaust()
         nodes = _extract_part_nodes(data, "test_header_v8")
         self.assertEqual(len(nodes), 2)
-        names = {n['name'] for n in nodes}
-        self.assertEqual(names, {"exm1r", "exm1l"})
+        self.assertEqual(sorted(n['name'] for n in nodes), ["exm1l", "exm1r"])
 
     def test_extract_part_nodes_nonexistent(self):
         data = _mock_engine_with_header_and_exhaust()
@@ -385,7 +431,7 @@ class TestSlotChainTracing(unittest.TestCase):
         data = _mock_engine_with_sibling_exhaust()
         slots = find_exhaust_slots_in_part(data, "test_engine_i6")
         # Should find both header AND exhaust sibling
-        types = [s[0] for s in slots]
+        types = {s[0] for s in slots}
         self.assertIn("test_header", types)
         self.assertIn("test_exhaust_i6", types)
 
@@ -393,7 +439,7 @@ class TestSlotChainTracing(unittest.TestCase):
         data = _mock_engine_with_sibling_exhaust()
         all_slots = find_all_child_slots(data, "test_engine_i6")
         self.assertEqual(len(all_slots), 2)
-        types = [s[0] for s in all_slots]
+        types = {s[0] for s in all_slots}
         self.assertIn("test_header", types)
         self.assertIn("test_exhaust_i6", types)
 
@@ -410,36 +456,36 @@ class TestSlotChainTracing(unittest.TestCase):
     def test_trace_chain_pattern_a(self):
         """Pattern A: engine → header → exhaust."""
         data = _mock_engine_with_header_and_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_v8", Path("."), "test")
+        chains = trace_exhaust_chain(data, "test_engine_v8", _DOT, "test")
         self.assertTrue(len(chains) >= 1)
         # Should find test_exhaust_v8 through the header
-        exhaust_types = [c.exhaust_slot_type for c in chains]
+        exhaust_types = {c.exhaust_slot_type for c in chains}
         self.assertIn("test_exhaust_v8", exhaust_types)
 
     def test_trace_chain_pattern_a_prime(self):
         """Pattern A': engine has sibling exhaust slot."""
         data = _mock_engine_with_sibling_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_i6", Path("."), "test")
+        chains = trace_exhaust_chain(data, "test_engine_i6", _DOT, "test")
         # Should find sibling exhaust AND header (leaf)
         self.assertTrue(len(chains) >= 2)
-        has_sibling = any('sibling' in c.chain_path.lower() for c in chains)
+        has_sibling = any(c.kind & ChainKind.SIBLING for c in chains)
         self.assertTrue(has_sibling)
 
     def test_trace_chain_pattern_b(self):
         """Pattern B: engine → intake → header → exhaust."""
         data = _mock_engine_intake_nested()
-        chains = trace_exhaust_chain(data, "test_engine_sohc", Path("."), "test")
+        chains = trace_exhaust_chain(data, "test_engine_sohc", _DOT, "test")
         self.assertTrue(len(chains) >= 1)
-        exhaust_types = [c.exhaust_slot_type for c in chains]
+        exhaust_types = {c.exhaust_slot_type for c in chains}
         self.assertIn("test_exhaust", exhaust_types)
         # Chain should go through intake
-        has_intake_path = any('intake' in c.chain_path.lower() for c in chains)
+        has_intake_path = any(c.kind & ChainKind.VIA_INTAKE for c in chains)
         self.assertTrue(has_intake_path, f"Expected intake in chain path, got: {[c.chain_path for c in chains]}")
 
     def test_trace_chain_records_node_info(self):
         """Chain tracing should capture downstream component nodes."""
         data = _mock_engine_with_header_and_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_v8", Path("."), "test")
+        chains = trace_exhaust_chain(data, "test_engine_v8", _DOT, "test")
         exhaust_chain = [c for c in chains if c.exhaust_slot_type == "test_exhaust_v8"][0]
         self.assertEqual(len(exhaust_chain.node_names), 2)
         self.assertIn("exm1r", exhaust_chain.node_names)
@@ -450,7 +496,7 @@ class TestSlotChainTracing(unittest.TestCase):
         data = _mock_engine_slots2()
         slots = find_exhaust_slots_in_part(data, "test_engine_modern")
         # "test_header" matches EXHAUST_SLOT_PATTERNS via "header"
-        types = [s[0] for s in slots]
+        types = {s[0] for s in slots}
         self.assertIn("test_header", types)
 
 
@@ -463,34 +509,46 @@ class TestPatternClassification(unittest.TestCase):
 
     def test_classify_pattern_a(self):
         data = _mock_engine_with_header_and_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_v8", Path("."), "test")
-        pattern = classify_pattern(chains, Path("."), "test", data, "test_engine_v8")
+        chains = trace_exhaust_chain(data, "test_engine_v8", _DOT, "test")
+        pattern = classify_pattern(chains, _DOT, "test", data, "test_engine_v8")
         self.assertEqual(pattern, "A")
 
     def test_classify_pattern_a_prime(self):
         data = _mock_engine_with_sibling_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_i6", Path("."), "test")
-        pattern = classify_pattern(chains, Path("."), "test", data, "test_engine_i6")
+        chains = trace_exhaust_chain(data, "test_engine_i6", _DOT, "test")
+        pattern = classify_pattern(chains, _DOT, "test", data, "test_engine_i6")
         self.assertEqual(pattern, "A'")
 
     def test_classify_pattern_b(self):
         data = _mock_engine_intake_nested()
-        chains = trace_exhaust_chain(data, "test_engine_sohc", Path("."), "test")
-        pattern = classify_pattern(chains, Path("."), "test", data, "test_engine_sohc")
+        chains = trace_exhaust_chain(data, "test_engine_sohc", _DOT, "test")
+        pattern = classify_pattern(chains, _DOT, "test", data, "test_engine_sohc")
         self.assertEqual(pattern, "B")
 
     def test_classify_pattern_c(self):
         data = _mock_body_frame_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_turbo", Path("."), "test")
-        pattern = classify_pattern(chains, Path("."), "test", data, "test_engine_turbo")
+        chains = trace_exhaust_chain(data, "test_engine_turbo", _DOT, "test")
+        pattern = classify_pattern(chains, _DOT, "test", data, "test_engine_turbo")
         self.assertEqual(pattern, "C")
 
     def test_classify_no_exhaust(self):
         data = _mock_engine_no_exhaust()
-        chains = trace_exhaust_chain(data, "test_engine_electric", Path("."), "test")
-        pattern = classify_pattern(chains, Path("."), "test", data, "test_engine_electric")
+        chains = trace_exhaust_chain(data, "test_engine_electric", _DOT, "test")
+        pattern = classify_pattern(chains, _DOT, "test", data, "test_engine_electric")
         self.assertEqual(pattern, "no_exhaust")
 
+    def test_classify_uses_chain_path_of_built_chains(self):
+        """Chains built directly (not traced) are classified from chain_path."""
+        data = _mock_engine_with_header_and_exhaust()
+        sibling = ExhaustSlotInfo("(engine sibling)", "x_exhaust", "x_exhaust",
+                                  "test_engine_v8 → x_exhaust (sibling slot)")
+        nested = ExhaustSlotInfo("h", "x_header", "x_exhaust",
+                                 "test_engine_v8 → x_intake[i] → x_header[h] → x_exhaust")
+        self.assertEqual(
+            classify_pattern([sibling], _DOT, "test", data, "test_engine_v8"), "A'")
+        self.assertEqual(
+            classify_pattern([nested], _DOT, "test", data, "test_engine_v8"), "B")
+
 
 # =========================================================================
 # Unit Tests — Candidate Classification & Strategy Selection
@@ -572,9 +630,43 @@ class TestCandidateClassification(unittest.TestCase):
 # Integration Tests — Real Vehicle Data
 # =========================================================================
 
+@functools.lru_cache(maxsize=32)
+def _cached_vehicle_profiles(base_path: Path, vehicle: str) -> List[EngineExhaustProfile]:
+    """profile_vehicle_exhausts() memoized per (base_path, vehicle); read-only."""
+    return profile_vehicle_exhausts(base_path, vehicle)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_body_frame_exhaust_slots(base_path: Path, vehicle: str):
+    """find_body_frame_exhaust_slots() memoized per (base_path, vehicle); read-only."""
+    return find_body_frame_exhaust_slots(base_path, vehicle)
+
+
+def _expand_vehicle_cases(cls):
+    """Generate one test per VEHICLE_EXPECTATIONS row for each _check_vehicle_* method.
+
+    Stdlib stand-in for parameterized.expand: every vehicle becomes its own
+    test item, so runners can report, select and distribute them separately.
+    """
+    checks = [name for name in vars(cls) if name.startswith('_check_vehicle_')]
+    for case in cls.VEHICLE_EXPECTATIONS:
+        for check in checks:
+            def test(self, check=check, case=case):
+                getattr(self, check)(*case)
+            test.__name__ = f"test{check[len('_check'):]}_{case[0]}"
+            test.__doc__ = f"{getattr(cls, check).__doc__.rstrip('.')} ({case[0]})."
+            setattr(cls, test.__name__, test)
+    return cls
+
+
 @unittest.skipUnless(STEAM_BASE.exists(), "SteamLibrary_content_vehicles not available")
+@_expand_vehicle_cases
 class TestIntegrationVehicles(unittest.TestCase):
-    """Integration tests against real BeamNG vehicle data."""
+    """Integration tests against real BeamNG vehicle data.
+
+    Several tests profile the same vehicles, so profiles and body/frame scans
+    are shared through lru_cache wrappers for the lifetime of the class.
+    """
 
     # Expected: (vehicle, min_engines_with_exhaust, expected_patterns, expected_exhaust_slot_substring)
     VEHICLE_EXPECTATIONS = [
@@ -586,60 +678,61 @@ class TestIntegrationVehicles(unittest.TestCase):
         ("barstow", 1, {"A'"}, "exhaust"),
     ]
 
-    def test_vehicle_profiles(self):
-        """Each vehicle should produce at least one engine profile with exhaust."""
-        for vehicle, min_engines, expected_patterns, exhaust_substr in self.VEHICLE_EXPECTATIONS:
-            with self.subTest(vehicle=vehicle):
-                profiles = profile_vehicle_exhausts(STEAM_BASE, vehicle)
-
-                # Filter to profiles that have a real exhaust chain
-                with_exhaust = [
-                    p for p in profiles
-                    if p.pattern != "no_exhaust"
-                ]
-
-                self.assertGreaterEqual(
-                    len(with_exhaust), min_engines,
-                    f"{vehicle}: expected ≥{min_engines} engines with exhaust, "
-                    f"got {len(with_exhaust)}"
-                )
+    @classmethod
+    def tearDownClass(cls):
+        _cached_vehicle_profiles.cache_clear()
+        _cached_body_frame_exhaust_slots.cache_clear()
 
-                # Check that at least one profile matches an expected pattern
-                found_patterns = {p.pattern for p in with_exhaust}
-                self.assertTrue(
-                    found_patterns & expected_patterns,
-                    f"{vehicle}: expected one of {expected_patterns}, "
-                    f"got {found_patterns}"
-                )
+    def _check_vehicle_profiles(self, vehicle, min_engines, expected_patterns, exhaust_substr):
+        """Vehicle should produce at least one engine profile with exhaust."""
+        profiles = _cached_vehicle_profiles(STEAM_BASE, vehicle)
 
-    def test_vehicle_has_exhaust_slot(self):
-        """Each vehicle should have a discoverable exhaust slotType."""
-        for vehicle, _, _, exhaust_substr in self.VEHICLE_EXPECTATIONS:
-            with self.subTest(vehicle=vehicle):
-                profiles = profile_vehicle_exhausts(STEAM_BASE, vehicle)
-                with_exhaust = [p for p in profiles if p.pattern != "no_exhaust"]
-
-                # At least one profile should have a real exhaust slot
-                all_slots = []
-                for p in with_exhaust:
-                    for s in p.exhaust_slots:
-                        if s.exhaust_slot_type != "(none found)":
-                            all_slots.append(s.exhaust_slot_type)
-
-                # If pattern is C, also check body/frame
-                if not all_slots:
-                    body_exhaust = find_body_frame_exhaust_slots(STEAM_BASE, vehicle)
-                    all_slots = [s[2] for s in body_exhaust]
-
-                self.assertTrue(
-                    any(exhaust_substr in s.lower() for s in all_slots),
-                    f"{vehicle}: no exhaust slot found containing '{exhaust_substr}', "
-                    f"got: {all_slots}"
-                )
+        # Filter to profiles that have a real exhaust chain
+        with_exhaust = [
+            p for p in profiles
+            if p.pattern != "no_exhaust"
+        ]
+
+        self.assertGreaterEqual(
+            len(with_exhaust), min_engines,
+            f"{vehicle}: expected ≥{min_engines} engines with exhaust, "
+            f"got {len(with_exhaust)}"
+        )
+
+        # Check that at least one profile matches an expected pattern
+        found_patterns = {p.pattern for p in with_exhaust}
+        self.assertTrue(
+            found_patterns & expected_patterns,
+            f"{vehicle}: expected one of {expected_patterns}, "
+            f"got {found_patterns}"
+        )
+
+    def _check_vehicle_has_exhaust_slot(self, vehicle, min_engines, expected_patterns, exhaust_substr):
+        """Vehicle should have a discoverable exhaust slotType."""
+        profiles = _cached_vehicle_profiles(STEAM_BASE, vehicle)
+        with_exhaust = [p for p in profiles if p.pattern != "no_exhaust"]
+
+        # At least one profile should have a real exhaust slot
+        all_slots = []
+        for p in with_exhaust:
+            for s in p.exhaust_slots:
+                if s.exhaust_slot_type != "(none found)":
+                    all_slots.append(s.exhaust_slot_type)
+
+        # If pattern is C, also check body/frame
+        if not all_slots:
+            body_exhaust = _cached_body_frame_exhaust_slots(STEAM_BASE, vehicle)
+            all_slots = [s[2] for s in body_exhaust]
+
+        self.assertTrue(
+            any(exhaust_substr in s.lower() for s in all_slots),
+            f"{vehicle}: no exhaust slot found containing '{exhaust_substr}', "
+            f"got: {all_slots}"
+        )
 
     def test_pickup_isexhaust_count(self):
         """Pickup gasoline V8 engines should have 2 isExhaust nodes."""
-        profiles = profile_vehicle_exhausts(STEAM_BASE, "pickup")
+        profiles = _cached_vehicle_profiles(STEAM_BASE, "pickup")
         v8_profiles = [
             p for p in profiles
             if 'v8' in p.engine_name.lower()
@@ -653,7 +746,7 @@ class TestIntegrationVehicles(unittest.TestCase):
 
     def test_moonhawk_isexhaust_count(self):
         """Moonhawk engines should have 1 isExhaust node."""
-        profiles = profile_vehicle_exhausts(STEAM_BASE, "moonhawk")
+        profiles = _cached_vehicle_profiles(STEAM_BASE, "moonhawk")
         with_exhaust = [p for p in profiles if p.is_exhaust_count > 0]
         self.assertTrue(len(with_exhaust) > 0)
         for p in with_exhaust:
@@ -698,7 +791,7 @@ class TestIntegrationVehicles(unittest.TestCase):
 
     def test_slots2_vivace(self):
         """Vivace uses slots2 format — verify we can find body exhaust."""
-        body_exhaust = find_body_frame_exhaust_slots(STEAM_BASE, "vivace")
+        body_exhaust = _cached_body_frame_exhaust_slots(STEAM_BASE, "vivace")
         self.assertTrue(
             len(body_exhaust) > 0,
             "Expected to find exhaust slots in vivace body (slots2 format)"
@@ -724,17 +817,26 @@ class TestDonorCounting(unittest.TestCase):
         if not adapted_dir.exists():
             self.skipTest("No adapted pickup engines available")
 
-        adapted_files = list(adapted_dir.glob("*camso*adapted*.jbeam"))
-        if not adapted_files:
+        # Equivalent to glob("*camso*adapted*.jbeam"), consumed lazily so
+        # listing and parsing stop at the first file with isExhaust nodes
+        found_any = False
+        with os.scandir(adapted_dir) as it:
+            adapted_files = (
+                Path(e.path) for e in it
+                if e.name.endswith(".jbeam")
+                and "adapted" in e.name.partition("camso")[2][:-6]
+                and e.is_file()
+            )
+            for f in adapted_files:
+                found_any = True
+                count, nodes = count_donor_isExhaust_nodes(f)
+                if count > 0:
+                    self.assertIn(count, (1, 2),
+                                  f"{f.name}: expected 1 or 2 isExhaust, got {count}")
+                    return
+
+        if not found_any:
             self.skipTest("No adapted engine files found")
-
-        for f in adapted_files:
-            count, nodes = count_donor_isExhaust_nodes(f)
-            if count > 0:
-                self.assertIn(count, (1, 2),
-                              f"{f.name}: expected 1 or 2 isExhaust, got {count}")
-                return
-
         self.fail("No adapted engine file had isExhaust nodes")
 
 
@@ -883,6 +985,22 @@ class TestBeamPropertyExtraction(unittest.TestCase):
         self.assertEqual(props['beamDamp'], 200)
 
 
+# Sections every generated exhaust adapter part must define
+_ADAPTER_PART_KEYS = frozenset({'nodes', 'beams', 'slots'})
+
+# Shared Phase 2 generator inputs (read-only): the dual-header downstream
+# pair, its single-node variant, and the matching dual donor engine nodes.
+_DS_DUAL: List[Dict[str, Any]] = [
+    {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
+    {'name': 'exm1l', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
+]
+_DS_SINGLE: List[Dict[str, Any]] = _DS_DUAL[:1]
+_DONOR_DUAL: List[IsExhaustNode] = [
+    IsExhaustNode('e2r', 0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
+    IsExhaustNode('e2l', -0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
+]
+
+
 # =========================================================================
 # Phase 2 — Unit Tests: Adapted Node Generation
 # =========================================================================
@@ -890,40 +1008,44 @@ class TestBeamPropertyExtraction(unittest.TestCase):
 class TestGenerateAdaptedNodes(unittest.TestCase):
     """Test generate_adapted_nodes."""
 
+    EXPECTED_ADAPTED_KEYS = frozenset({'selfCollision', 'collision', 'nodeWeight', 'group'})
+
     def test_basic_generation(self):
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-            {'name': 'exm1l', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        downstream = _DS_DUAL
         rows = generate_adapted_nodes(downstream)
         # First row: header
         self.assertEqual(rows[0], ["id", "posX", "posY", "posZ"])
-        # Rows 1-6: separate property modifier rows (BeamNG convention)
-        modifiers = [r for r in rows[1:] if isinstance(r, dict) and 'group' not in r or (isinstance(r, dict) and r.get('group') != 'none')]
+        # Classify the remaining rows in one pass: separate property
+        # modifier rows (BeamNG convention) and the node rows after them
         modifier_keys = set()
-        for m in rows[1:]:
-            if isinstance(m, dict):
-                modifier_keys.update(m.keys())
-        self.assertIn('selfCollision', modifier_keys)
-        self.assertIn('collision', modifier_keys)
-        self.assertIn('nodeWeight', modifier_keys)
-        self.assertIn('group', modifier_keys)
-        # Find the nodeWeight modifier — should be 4.5 (>=3 required for stability)
-        for m in rows[1:]:
-            if isinstance(m, dict) and 'nodeWeight' in m:
-                self.assertEqual(m['nodeWeight'], 4.5)
-        # Find the collision modifier — should be False
-        for m in rows[1:]:
-            if isinstance(m, dict) and 'collision' in m:
-                self.assertFalse(m['collision'])
-        # Find the group modifier — should set exhaust_adapter
-        for m in rows[1:]:
-            if isinstance(m, dict) and m.get('group') == 'exhaust_adapter':
-                break
-        else:
-            self.fail("No group modifier with 'exhaust_adapter' found")
+        node_weights = []
+        collisions = []
+        groups = []
+        node_rows = []
+        for r in rows[1:]:
+            t = type(r)
+            if t is dict:
+                modifier_keys.update(r)
+                if 'nodeWeight' in r:
+                    node_weights.append(r['nodeWeight'])
+                if 'collision' in r:
+                    collisions.append(r['collision'])
+                if 'group' in r:
+                    groups.append(r['group'])
+            elif t is list and len(r) >= 4 and r[0] != 'id':
+                node_rows.append(r)
+        self.assertFalse(self.EXPECTED_ADAPTED_KEYS - modifier_keys,
+                         "Missing node modifier keys")
+        # nodeWeight modifier should be 4.5 (>=3 required for stability)
+        for w in node_weights:
+            self.assertEqual(w, 4.5)
+        # collision modifier should be False
+        for c in collisions:
+            self.assertFalse(c)
+        # A group modifier should set exhaust_adapter
+        self.assertIn('exhaust_adapter', groups,
+                      "No group modifier with 'exhaust_adapter' found")
         # Node rows follow modifiers
-        node_rows = [r for r in rows if isinstance(r, list) and len(r) >= 4 and r[0] not in ('id',)]
         self.assertEqual(node_rows[0][0], 'exm1r')
         self.assertEqual(node_rows[1][0], 'exm1l')
         # Trailing group:none reset
@@ -938,7 +1060,7 @@ class TestGenerateAdaptedNodes(unittest.TestCase):
         ]
         rows = generate_adapted_nodes(downstream)
         # Find the node row (list with 5 elements: name, x, y, z, props)
-        node_rows = [r for r in rows if isinstance(r, list) and len(r) >= 4 and r[0] not in ('id',)]
+        node_rows = [r for r in rows[1:] if type(r) is list]
         self.assertEqual(len(node_rows), 1)
         node_row = node_rows[0]
         self.assertEqual(len(node_row), 5)  # name, x, y, z, props
@@ -956,55 +1078,54 @@ class TestGenerateAdaptedNodes(unittest.TestCase):
 class TestGenerateStructuralBeams(unittest.TestCase):
     """Test generate_structural_beams."""
 
+    EXPECTED_BEAM_MOD_KEYS = frozenset({
+        'deformLimitExpansion', 'beamSpring', 'beamDamp',
+        'beamDeform', 'beamStrength', 'beamPrecompression',
+    })
+
     def test_basic_dual_node(self):
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-            {'name': 'exm1l', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        downstream = _DS_DUAL
         # 2 isExhaust nodes — 6 non-isExhaust engine nodes left
-        engine_nodes = [
-            IsExhaustNode('e2r', 0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-            IsExhaustNode('e2l', -0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-        ]
+        engine_nodes = _DONOR_DUAL
         beam_props = {'beamSpring': 1616333, 'beamDamp': 130.43,
                       'beamDeform': 90000, 'beamStrength': 'FLT_MAX'}
 
         rows = generate_structural_beams(downstream, engine_nodes, beam_props)
         # Header
         self.assertEqual(rows[0], ["id1:", "id2:"])
-        # Modifier rows — separate per BeamNG convention
-        modifier_rows = [r for r in rows if isinstance(r, dict)]
+        # Classify rows in one pass: separate modifier rows (BeamNG
+        # convention) and the [node, node] beam entries
         modifier_keys = set()
-        for m in modifier_rows:
-            modifier_keys.update(m.keys())
-        self.assertIn('deformLimitExpansion', modifier_keys)
-        self.assertIn('beamSpring', modifier_keys)
-        self.assertIn('beamDamp', modifier_keys)
-        self.assertIn('beamDeform', modifier_keys)
-        self.assertIn('beamStrength', modifier_keys)
-        self.assertIn('beamPrecompression', modifier_keys)
+        beam_springs = []
+        beam_entries = []
+        for r in rows:
+            t = type(r)
+            if t is dict:
+                modifier_keys.update(r)
+                if 'beamSpring' in r:
+                    beam_springs.append(r['beamSpring'])
+            elif t is list and len(r) == 2 and type(r[0]) is str and r[0] != 'id1:':
+                beam_entries.append(r)
+        self.assertFalse(self.EXPECTED_BEAM_MOD_KEYS - modifier_keys,
+                         "Missing beam modifier keys")
         # Verify beamSpring value
-        for m in modifier_rows:
-            if 'beamSpring' in m:
-                self.assertEqual(m['beamSpring'], 1616333)
+        for spring in beam_springs:
+            self.assertEqual(spring, 1616333)
         # 2 downstream × 6 structural targets = 12 beams
-        beam_entries = [r for r in rows if isinstance(r, list) and len(r) == 2 and isinstance(r[0], str) and r[0] != 'id1:']
         self.assertEqual(len(beam_entries), 12)
         # Verify no beams reference isExhaust nodes
         for beam in beam_entries:
             self.assertNotIn(beam[1], ['e2r', 'e2l'])
 
     def test_single_node(self):
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        downstream = _DS_SINGLE
         engine_nodes = [
             IsExhaustNode('e3r', 0.2, -1.0, 0.4, 'engine_block', 't', 'f'),
         ]
         beam_props = dict(_DEFAULT_BEAM_PROPS)
 
         rows = generate_structural_beams(downstream, engine_nodes, beam_props)
-        beam_entries = [r for r in rows[2:] if isinstance(r, list)]
+        beam_entries = [r for r in rows[1:] if type(r) is list]
         # 1 downstream × 7 structural targets = 7 beams
         self.assertEqual(len(beam_entries), 7)
         # e3r is isExhaust — should not appear as target
@@ -1032,21 +1153,16 @@ class TestMatchingIsExhaustBeams(unittest.TestCase):
 
     def test_dual_2_to_2_distance_pairing(self):
         # Donor nodes: e2r is at +X, e2l is at -X
-        donor = [
-            IsExhaustNode('e2r', 0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-            IsExhaustNode('e2l', -0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-        ]
+        donor = _DONOR_DUAL
         # Downstream nodes: exm1r at +X, exm1l at -X
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-            {'name': 'exm1l', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        downstream = _DS_DUAL
         beams = generate_matching_isExhaust_beams(donor, downstream)
         self.assertEqual(len(beams), 2)
         # Distance pairing should match e2r→exm1r and e2l→exm1l
-        nodes_paired = {(b[0], b[1]) for b in beams}
-        self.assertIn(('e2r', 'exm1r'), nodes_paired)
-        self.assertIn(('e2l', 'exm1l'), nodes_paired)
+        self.assertEqual(
+            sorted((b[0], b[1]) for b in beams),
+            [('e2l', 'exm1l'), ('e2r', 'exm1r')],
+        )
         # Each beam has isExhaust
         for beam in beams:
             self.assertEqual(beam[2], {"isExhaust": "mainEngine"})
@@ -1054,10 +1170,7 @@ class TestMatchingIsExhaustBeams(unittest.TestCase):
     def test_dual_2_to_2_cross_pairing(self):
         """When closest nodes are cross-paired (R↔L), verify correct matching."""
         # Deliberately swap downstream node positions
-        donor = [
-            IsExhaustNode('e2r', 0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-            IsExhaustNode('e2l', -0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-        ]
+        donor = _DONOR_DUAL
         downstream = [
             {'name': 'exm1r', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},  # at -X!
             {'name': 'exm1l', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},   # at +X!
@@ -1065,25 +1178,20 @@ class TestMatchingIsExhaustBeams(unittest.TestCase):
         beams = generate_matching_isExhaust_beams(donor, downstream)
         self.assertEqual(len(beams), 2)
         # Distance pairing should cross: e2r→exm1l (+X nearer +X), e2l→exm1r (-X nearer -X)
-        nodes_paired = {(b[0], b[1]) for b in beams}
-        self.assertIn(('e2r', 'exm1l'), nodes_paired)
-        self.assertIn(('e2l', 'exm1r'), nodes_paired)
+        self.assertEqual(
+            sorted((b[0], b[1]) for b in beams),
+            [('e2l', 'exm1r'), ('e2r', 'exm1l')],
+        )
 
     def test_no_duplicate_connections(self):
         """Each node consumed exactly once (2↔2)."""
-        donor = [
-            IsExhaustNode('e2r', 0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-            IsExhaustNode('e2l', -0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-        ]
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-            {'name': 'exm1l', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        donor = _DONOR_DUAL
+        downstream = _DS_DUAL
         beams = generate_matching_isExhaust_beams(donor, downstream)
-        donor_used = [b[0] for b in beams]
-        ds_used = [b[1] for b in beams]
-        self.assertEqual(len(set(donor_used)), 2, "Donor nodes not unique")
-        self.assertEqual(len(set(ds_used)), 2, "Downstream nodes not unique")
+        donor_used = {b[0] for b in beams}
+        ds_used = {b[1] for b in beams}
+        self.assertEqual(len(donor_used), 2, "Donor nodes not unique")
+        self.assertEqual(len(ds_used), 2, "Downstream nodes not unique")
 
     def test_empty_inputs(self):
         beams = generate_matching_isExhaust_beams([], [])
@@ -1095,10 +1203,7 @@ class TestMismatchIsExhaustBeams(unittest.TestCase):
 
     def test_1_to_2_splitter(self):
         donor = [IsExhaustNode('e4r', 0.2, -1.0, 0.5, 'engine_block', 't', 'f')]
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-            {'name': 'exm1l', 'x': -0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        downstream = _DS_DUAL
         beams = generate_mismatch_isExhaust_beams(donor, downstream)
         # 1 donor × 2 downstream = 2 beams
         self.assertEqual(len(beams), 2)
@@ -1107,13 +1212,8 @@ class TestMismatchIsExhaustBeams(unittest.TestCase):
             self.assertEqual(beam[2], {"isExhaust": "mainEngine"})
 
     def test_2_to_1_collector(self):
-        donor = [
-            IsExhaustNode('e2r', 0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-            IsExhaustNode('e2l', -0.2, -1.0, 0.3, 'engine_block', 't', 'f'),
-        ]
-        downstream = [
-            {'name': 'exm1r', 'x': 0.3, 'y': -0.8, 'z': 0.1, 'props': {}},
-        ]
+        donor = _DONOR_DUAL
+        downstream = _DS_SINGLE
         beams = generate_mismatch_isExhaust_beams(donor, downstream)
         # 2 donor × 1 downstream = 2 beams
         self.assertEqual(len(beams), 2)
@@ -1171,17 +1271,12 @@ class TestGenerateAdaptedExhaustComponent(unittest.TestCase):
         )
 
     def _make_merged_data_A(self):
-        """Pattern A merged data with header beams."""
-        data = _mock_engine_with_header_and_exhaust()
-        # Add beams to header for beam property extraction
-        data["test_header_v8"]["beams"] = [
-            ["id1:", "id2:"],
-            {"beamSpring": 11163370, "beamDamp": 130.43,
-             "beamDeform": 90000, "beamStrength": "FLT_MAX"},
-            ["exm1r", "e2r", {"isExhaust": "mainEngine"}],
-            ["exm1l", "e2l", {"isExhaust": "mainEngine"}],
-        ]
-        return data
+        """Pattern A merged data with header beams.
+
+        Returns the shared module fixture; a test that needs to modify it
+        should deepcopy _MOCK_MERGED_A_WITH_BEAMS itself.
+        """
+        return _MOCK_MERGED_A_WITH_BEAMS
 
     def test_matching_strategy_dual(self):
         """Matching strategy with 2 donor / 2 target isExhaust nodes."""
@@ -1201,9 +1296,8 @@ class TestGenerateAdaptedExhaustComponent(unittest.TestCase):
         # Check part structure
         part_data = part["test_exhaust_adapter"]
         self.assertEqual(part_data['slotType'], 'test_exhaust_adapter')
-        self.assertIn('nodes', part_data)
-        self.assertIn('beams', part_data)
-        self.assertIn('slots', part_data)
+        self.assertFalse(_ADAPTER_PART_KEYS.difference(part_data),
+                         "Adapter part missing nodes/beams/slots")
 
         # Check child exhaust slot
         child_slots = part_data['slots']
@@ -1240,7 +1334,7 @@ class TestGenerateAdaptedExhaustComponent(unittest.TestCase):
             ],
             pattern="A",
         )
-        merged = _mock_engine_with_sibling_exhaust()
+        merged = copy.deepcopy(_mock_engine_with_sibling_exhaust())
         merged["test_header_i6"]["beams"] = [
             ["id1:", "id2:"],
             {"beamSpring": 5010000, "beamDamp": 90, "beamDeform": 90000, "beamStrength": "FLT_MAX"},
@@ -1394,7 +1488,36 @@ class TestGetBestExhaustSlotInfo(unittest.TestCase):
 class TestIntegrationPhase2(unittest.TestCase):
     """Integration tests: select_strategy with donor nodes → full component."""
 
-    def _make_donor_nodes(self, count, names=None):
+    # Distinct (vehicle, donor count, donor node names) inputs used below;
+    # names=None runs without donor nodes (Phase 1 behavior)
+    _CASES = (
+        ("pickup", 2, ('e2r', 'e2l')),
+        ("pickup", 3, ('e2r', 'e2l', 'e4r')),
+        ("moonhawk", 1, ('e4r',)),
+        ("covet", 1, ('e3r',)),
+        ("barstow", 1, ('e4r',)),
+        ("pickup", 2, None),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        # Donor node lists are frozen IsExhaustNodes, built once per distinct
+        # (count, names) and shared by every case that uses them
+        cls._donors = {
+            (count, names): cls._make_donor_nodes(count, names)
+            for _, count, names in cls._CASES if names is not None
+        }
+        # select_strategy scans the vehicle tree; run each distinct case once
+        # and share the (read-only) result between the tests that need it
+        cls._results = {
+            (vehicle, count, names): select_strategy(
+                STEAM_BASE, vehicle, count, cls._donors.get((count, names)),
+            )
+            for vehicle, count, names in cls._CASES
+        }
+
+    @staticmethod
+    def _make_donor_nodes(count, names=None):
         """Create mock donor isExhaust nodes with plausible positions."""
         if names is None:
             names = ['e2r', 'e2l', 'e4r'][:count]
@@ -1409,8 +1532,7 @@ class TestIntegrationPhase2(unittest.TestCase):
 
     def test_pickup_matching_2_generates_component(self):
         """Pickup with 2 donor isExhaust → matching strategy → component generated."""
-        donor_nodes = self._make_donor_nodes(2)
-        result = select_strategy(STEAM_BASE, "pickup", 2, donor_nodes)
+        result = self._results["pickup", 2, ('e2r', 'e2l')]
         self.assertEqual(result.strategy, "matching")
         self.assertIsNotNone(result.adapted_part, "adapted_part should be generated")
         self.assertIn("pickup_exhaust_adapter", result.adapted_part)
@@ -1419,69 +1541,64 @@ class TestIntegrationPhase2(unittest.TestCase):
 
         # Verify the part has nodes and beams
         part = result.adapted_part["pickup_exhaust_adapter"]
-        self.assertIn('nodes', part)
-        self.assertIn('beams', part)
-        self.assertIn('slots', part)
+        self.assertFalse(_ADAPTER_PART_KEYS.difference(part),
+                         "Adapter part missing nodes/beams/slots")
 
     def test_pickup_mismatch_3_generates_component(self):
         """Pickup with 3 donor isExhaust → mismatch (no engine matches 3).
         Best candidate is I6 (1 target, Pattern A), so 3×1 = 3 isExhaust beams."""
-        donor_nodes = self._make_donor_nodes(3, names=['e2r', 'e2l', 'e4r'])
-        result = select_strategy(STEAM_BASE, "pickup", 3, donor_nodes)
+        result = self._results["pickup", 3, ('e2r', 'e2l', 'e4r')]
         self.assertEqual(result.strategy, "mismatch")
         self.assertIsNotNone(result.adapted_part)
         part = result.adapted_part["pickup_exhaust_adapter"]
 
         # Mismatch Y-pipe: 3 donor × 1 downstream (I6 header) = 3 isExhaust beams
-        is_exhaust_beams = [
-            b for b in part['beams']
-            if isinstance(b, list) and len(b) == 3
-            and isinstance(b[2], dict) and 'isExhaust' in b[2]
-        ]
-        self.assertEqual(len(is_exhaust_beams), 3)
+        is_exhaust_count = sum(
+            1 for b in part['beams']
+            if type(b) is list and len(b) == 3
+            and type(b[2]) is dict and 'isExhaust' in b[2]
+        )
+        self.assertEqual(is_exhaust_count, 3)
 
     def test_moonhawk_matching_1_generates_component(self):
         """Moonhawk with 1 donor → matching strategy → component."""
-        donor_nodes = self._make_donor_nodes(1, names=['e4r'])
-        result = select_strategy(STEAM_BASE, "moonhawk", 1, donor_nodes)
+        result = self._results["moonhawk", 1, ('e4r',)]
         self.assertIn(result.strategy, ("matching", "mismatch"))
         self.assertIsNotNone(result.adapted_part)
 
     def test_covet_aprime_no_header_returns_none(self):
         """Covet 1.5_R is A' with sibling-only chain — no header nodes to bridge.
         Component generation correctly returns None with a warning."""
-        donor_nodes = self._make_donor_nodes(1, names=['e3r'])
-        result = select_strategy(STEAM_BASE, "covet", 1, donor_nodes)
+        result = self._results["covet", 1, ('e3r',)]
         self.assertIn(result.strategy, ("matching", "mismatch"))
         # A'-only with no header nodes → adapted_part is None
         self.assertIsNone(result.adapted_part)
 
     def test_barstow_matching_1_generates_component(self):
         """Barstow with 1 donor → matching → component."""
-        donor_nodes = self._make_donor_nodes(1, names=['e4r'])
-        result = select_strategy(STEAM_BASE, "barstow", 1, donor_nodes)
+        result = self._results["barstow", 1, ('e4r',)]
         self.assertIn(result.strategy, ("matching", "mismatch"))
         self.assertIsNotNone(result.adapted_part)
 
     def test_no_donor_nodes_means_no_component(self):
         """Without donor_isExhaust_nodes, no component is generated (Phase 1 behavior)."""
-        result = select_strategy(STEAM_BASE, "pickup", 2)
+        result = self._results["pickup", 2, None]
         self.assertEqual(result.strategy, "matching")
         self.assertIsNone(result.adapted_part)
         self.assertIsNone(result.exhaust_slot_entry)
 
     def test_child_exhaust_slot_matches_target(self):
         """The adapted component's child exhaust slot matches the target vehicle's exhaust slotType."""
-        donor_nodes = self._make_donor_nodes(2)
-        result = select_strategy(STEAM_BASE, "pickup", 2, donor_nodes)
+        result = self._results["pickup", 2, ('e2r', 'e2l')]
         self.assertIsNotNone(result.adapted_part)
         part = result.adapted_part["pickup_exhaust_adapter"]
-        # Find the exhaust child slot in the part's slots
-        exhaust_child = None
-        for s in part.get('slots', []):
-            if isinstance(s, list) and 'exhaust' in str(s[0]).lower():
-                exhaust_child = s
-                break
+        # Find the exhaust child slot in the part's slots. Slot types are
+        # vehicle-prefixed (e.g. pickup_exhaust_*), so match a substring
+        exhaust_child = next(
+            (s for s in part.get('slots', ())
+             if type(s) is list and 'exhaust' in str(s[0]).lower()),
+            None,
+        )
         self.assertIsNotNone(exhaust_child, "No child exhaust slot in adapted part")
         # Should match the result's target_exhaust_slot_type
         self.assertEqual(exhaust_child[0], result.target_exhaust_slot_type)
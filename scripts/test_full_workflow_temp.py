@@ -10,13 +10,20 @@ Tests the complete mount solver pipeline:
 6. Generate output nodes
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Add scripts directory to path
 SCRIPTS_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPTS_DIR))
 
+# Per-part/per-node detail listings; WORKFLOW_VERBOSE=0 keeps only step status,
+# warnings/errors and the summary (the solver itself always runs)
+VERBOSE = os.environ.get("WORKFLOW_VERBOSE", "1") == "1"
+
 from mount_solver import (
     DonorEngineExtractor,
     TargetVehicleExtractor,
@@ -24,7 +31,41 @@ from mount_solver import (
     SwapParameters,
     solve_engine_mount,
 )
-from engineswap import JBeamParser
+from _jbeam_cache import cached_parse, file_mtime_ns
+
+
+def _prefetch_parses(*paths: Path) -> None:
+    """Warm cached_parse for every existing path on a thread pool."""
+    existing = [(p, m) for p in paths if (m := file_mtime_ns(p)) is not None]
+    with ThreadPoolExecutor(max_workers=max(1, len(existing))) as pool:
+        for p, mtime_ns in existing:
+            pool.submit(cached_parse, str(p), mtime_ns)
+
+
+# The Camso engine uses TWO files:
+# - camso_engine_3813e.jbeam: Engine definition, slotType, powertrain
+# - camso_engine_structure_ec8ba.jbeam: Physical nodes (engine0-7)
+ENGINE_MAIN_PATH = Path(
+    r"M:\BeamNG_Modding_Temp\mods\unpacked\persh_crayenne_moracc\vehicles"
+    r"\persh_crayenne_moracc\eng_3813e\camso_engine_3813e.jbeam"
+)
+
+ENGINE_STRUCTURE_PATH = Path(
+    r"M:\BeamNG_Modding_Temp\mods\unpacked\persh_crayenne_moracc\vehicles"
+    r"\persh_crayenne_moracc\ec8ba\camso_engine_structure_ec8ba.jbeam"
+)
+
+# Pickup uses common folder architecture
+PICKUP_ENGINE_PATH = Path(
+    r"M:\BeamNG_Modding_Temp\SteamLibrary_content_vehicles\common"
+    r"\vehicles\common\pickup\pickup_engine_v8_5.5.jbeam"
+)
+
+PICKUP_TRANSMISSION_PATH = Path(
+    r"M:\BeamNG_Modding_Temp\SteamLibrary_content_vehicles\common"
+    r"\vehicles\common\pickup\pickup_transmission.jbeam"
+)
+
 
 def main():
     print("=" * 70)
@@ -56,40 +97,35 @@ def main():
     # ========================================================================
     print("\n[STEP 2] Parsing donor Camso 3813e engine...")
     
-    # The Camso engine uses TWO files:
-    # - camso_engine_3813e.jbeam: Engine definition, slotType, powertrain
-    # - camso_engine_structure_ec8ba.jbeam: Physical nodes (engine0-7)
-    
-    engine_main_path = Path(
-        r"M:\BeamNG_Modding_Temp\mods\unpacked\persh_crayenne_moracc\vehicles"
-        r"\persh_crayenne_moracc\eng_3813e\camso_engine_3813e.jbeam"
-    )
-    
-    engine_structure_path = Path(
-        r"M:\BeamNG_Modding_Temp\mods\unpacked\persh_crayenne_moracc\vehicles"
-        r"\persh_crayenne_moracc\ec8ba\camso_engine_structure_ec8ba.jbeam"
-    )
+    # The four jbeams are independent: parse them concurrently up front so
+    # STEPs 2 and 4 read finished results from the cached_parse cache
+    _prefetch_parses(ENGINE_MAIN_PATH, ENGINE_STRUCTURE_PATH,
+                     PICKUP_ENGINE_PATH, PICKUP_TRANSMISSION_PATH)
     
     donor_data = {}
     
     # Parse main engine file (for reference)
-    if engine_main_path.exists():
-        data = JBeamParser.parse_jbeam(engine_main_path)
+    mtime_ns = file_mtime_ns(ENGINE_MAIN_PATH)
+    if mtime_ns is not None:
+        data = cached_parse(str(ENGINE_MAIN_PATH), mtime_ns)
         if data:
             donor_data.update(data)
-            print(f"  ✓ Parsed {engine_main_path.name}")
+            print(f"  ✓ Parsed {ENGINE_MAIN_PATH.name}")
             # Show what we found
-            for part_name in list(data.keys())[:2]:
-                print(f"    - Found part: {part_name}")
+            if VERBOSE:
+                for part_name in islice(data, 2):
+                    print(f"    - Found part: {part_name}")
     
     # Parse structure file (contains nodes)
-    if engine_structure_path.exists():
-        data = JBeamParser.parse_jbeam(engine_structure_path)
+    mtime_ns = file_mtime_ns(ENGINE_STRUCTURE_PATH)
+    if mtime_ns is not None:
+        data = cached_parse(str(ENGINE_STRUCTURE_PATH), mtime_ns)
         if data:
             donor_data.update(data)
-            print(f"  ✓ Parsed {engine_structure_path.name}")
-            for part_name in data.keys():
-                print(f"    - Found part: {part_name}")
+            print(f"  ✓ Parsed {ENGINE_STRUCTURE_PATH.name}")
+            if VERBOSE:
+                for part_name in data.keys():
+                    print(f"    - Found part: {part_name}")
     
     if not donor_data:
         print("  ✗ ERROR: Failed to parse donor engine files")
@@ -132,28 +168,18 @@ def main():
     # ========================================================================
     print("\n[STEP 4] Parsing target pickup vehicle...")
     
-    # Pickup uses common folder architecture
-    pickup_engine_path = Path(
-        r"M:\BeamNG_Modding_Temp\SteamLibrary_content_vehicles\common"
-        r"\vehicles\common\pickup\pickup_engine_v8_5.5.jbeam"
-    )
-    
-    pickup_transmission_path = Path(
-        r"M:\BeamNG_Modding_Temp\SteamLibrary_content_vehicles\common"
-        r"\vehicles\common\pickup\pickup_transmission.jbeam"
-    )
-    
     target_data = {}
     
-    for filepath in [pickup_engine_path, pickup_transmission_path]:
-        if filepath.exists():
-            data = JBeamParser.parse_jbeam(filepath)
+    for filepath in [PICKUP_ENGINE_PATH, PICKUP_TRANSMISSION_PATH]:
+        mtime_ns = file_mtime_ns(filepath)
+        if mtime_ns is not None:
+            data = cached_parse(str(filepath), mtime_ns)
             if data:
                 target_data.update(data)
                 print(f"  ✓ Parsed {filepath.name}")
                 # Show first part found
-                if data:
-                    first_part = list(data.keys())[0]
+                if VERBOSE:
+                    first_part = next(iter(data))
                     print(f"    - Found part: {first_part}")
     
     if not target_data:
@@ -170,8 +196,9 @@ def main():
     # Extract mount nodes (em1l, em1r, tra1)
     target_mounts = target_extractor.extract_mounts()
     print(f"  ✓ Extracted {len(target_mounts)} mount nodes:")
-    for mount in target_mounts:
-        print(f"    - {mount.name} ({mount.mount_type}): ({mount.position.x:.3f}, {mount.position.y:.3f}, {mount.position.z:.3f})")
+    if VERBOSE:
+        for mount in target_mounts:
+            print(f"    - {mount.name} ({mount.mount_type}): ({mount.position.x:.3f}, {mount.position.y:.3f}, {mount.position.z:.3f})")
     
     # Extract reference engine cube (optional, for comparison)
     target_ref_cube = target_extractor.extract_engine_cube()
@@ -235,30 +262,34 @@ def main():
         translated_cube = result.engine_cube
         
         # Show translated positions
-        print(f"  Translated engine cube (BeamNG naming):")
-        print(f"    Node positions (sample):")
-        for name in ['e1l', 'e1r', 'e3l', 'e3r']:
-            if name in translated_cube.nodes:
-                node = translated_cube.nodes[name]
-                print(f"      {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})")
+        if VERBOSE:
+            print(f"  Translated engine cube (BeamNG naming):")
+            print(f"    Node positions (sample):")
+            for name in ['e1l', 'e1r', 'e3l', 'e3r']:
+                if name in translated_cube.nodes:
+                    node = translated_cube.nodes[name]
+                    print(f"      {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})")
         
-        # Check clearances to mount nodes
+        # Check clearances to mount nodes (the translated cube is fixed, so
+        # its AABB is computed once for all mounts)
         print(f"\n  Mount node clearances:")
+        min_c, max_c = translated_cube.get_aabb()
+        contains = translated_cube.contains_point
+        margin = -params.min_mount_clearance_m
         for mount in target_mounts:
-            inside = translated_cube.contains_point(mount.position, margin=-params.min_mount_clearance_m)
+            inside = contains(mount.position, margin=margin)
             status = "⚠ INSIDE" if inside else "✓ Clear"
             
             # Calculate distance to nearest face
-            min_c, max_c = translated_cube.get_aabb()
-            clearances = [
-                abs(mount.position.x - min_c.x),
-                abs(mount.position.x - max_c.x),
-                abs(mount.position.y - min_c.y),
-                abs(mount.position.y - max_c.y),
-                abs(mount.position.z - min_c.z),
-                abs(mount.position.z - max_c.z),
-            ]
-            min_clearance = min(clearances)
+            pos = mount.position
+            min_clearance = min(
+                abs(pos.x - min_c.x),
+                abs(pos.x - max_c.x),
+                abs(pos.y - min_c.y),
+                abs(pos.y - max_c.y),
+                abs(pos.z - min_c.z),
+                abs(pos.z - max_c.z),
+            )
             
             print(f"    {mount.name}: {status} (clearance: {min_clearance:.4f}m)")
     
@@ -270,15 +301,16 @@ def main():
     jbeam_nodes = result.to_jbeam_nodes()
     print(f"  ✓ Generated {len(jbeam_nodes)} node arrays")
     
-    print(f"\n  Sample output (first 3 nodes):")
-    for i, node_arr in enumerate(jbeam_nodes[:3]):
-        # Format: [name, x, y, z, {props}]
-        name = node_arr[0]
-        x, y, z = node_arr[1], node_arr[2], node_arr[3]
-        print(f"    [{name!r}, {x:.4f}, {y:.4f}, {z:.4f}, {{...}}]")
-    
-    if len(jbeam_nodes) > 3:
-        print(f"    ... and {len(jbeam_nodes) - 3} more nodes")
+    if VERBOSE:
+        print(f"\n  Sample output (first 3 nodes):")
+        for i, node_arr in enumerate(jbeam_nodes[:3]):
+            # Format: [name, x, y, z, {props}]
+            name = node_arr[0]
+            x, y, z = node_arr[1], node_arr[2], node_arr[3]
+            print(f"    [{name!r}, {x:.4f}, {y:.4f}, {z:.4f}, {{...}}]")
+        
+        if len(jbeam_nodes) > 3:
+            print(f"    ... and {len(jbeam_nodes) - 3} more nodes")
     
     # ========================================================================
     # STEP 9: Summary
@@ -6,6 +6,7 @@ with real Camso and pickup jbeam data.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add scripts directory to path
@@ -22,6 +23,42 @@ from mount_solver import (
 
 # Import the jbeam parser from engineswap
 from engineswap import JBeamParser
+from _jbeam_cache import cached_parse, file_mtime_ns
+
+
+def _print_nodes(nodes, sort: bool = True) -> None:
+    """Print node positions, one line each, in a single write.
+
+    Pass sort=False for dicts the extractors already build in canonical
+    order (gearbox nodes, target reference cube); donor cubes follow file
+    order and are sorted by name for display.
+    """
+    items = sorted(nodes.items()) if sort else nodes.items()
+    sys.stdout.write("".join(
+        f"    {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})\n"
+        for name, node in items
+    ))
+
+
+# Extraction is shared between the standalone extraction tests and
+# test_solver(); the tests themselves still print and check every call
+
+@lru_cache(maxsize=4)
+def _extract_donor(path_str: str, mtime_ns: int):
+    """(engine cube, gearbox nodes) for a Camso structure file; read-only."""
+    extractor = DonorEngineExtractor(cached_parse(path_str, mtime_ns))
+    cube = extractor.extract()
+    return cube, extractor.get_gearbox_nodes()
+
+
+@lru_cache(maxsize=4)
+def _extract_target(sources):
+    """(mount nodes, reference cube) from ((path, mtime_ns), ...) merged in order."""
+    combined_data = {}
+    for path_str, mtime_ns in sources:
+        combined_data.update(cached_parse(path_str, mtime_ns) or {})
+    extractor = TargetVehicleExtractor(combined_data)
+    return extractor.extract_mounts(), extractor.extract_engine_cube()
 
 
 def test_donor_extraction():
@@ -35,13 +72,14 @@ def test_donor_extraction():
         r"\persh_crayenne_moracc\ec8ba\camso_engine_structure_ec8ba.jbeam"
     )
     
-    if not camso_structure_path.exists():
+    mtime_ns = file_mtime_ns(camso_structure_path)
+    if mtime_ns is None:
         print(f"ERROR: File not found: {camso_structure_path}")
         return None
     
     # Parse the jbeam file using classmethod
     try:
-        data = JBeamParser.parse_jbeam(camso_structure_path)
+        data = cached_parse(str(camso_structure_path), mtime_ns)
         if data is None:
             print(f"ERROR: Failed to parse {camso_structure_path.name}")
             return None
@@ -51,15 +89,13 @@ def test_donor_extraction():
         return None
     
     # Extract engine cube
-    extractor = DonorEngineExtractor(data)
     try:
-        cube = extractor.extract()
+        cube, gearbox = _extract_donor(str(camso_structure_path), mtime_ns)
         print(f"✓ Extracted engine cube with {len(cube.nodes)} nodes")
         
         # Display nodes
         print("\n  Engine Cube Nodes:")
-        for name, node in sorted(cube.nodes.items()):
-            print(f"    {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})")
+        _print_nodes(cube.nodes)
         
         # Display derived geometry
         print(f"\n  Centroid: {cube.centroid}")
@@ -78,11 +114,9 @@ def test_donor_extraction():
         print(f"  Flywheel plane centroid Y: {flywheel_centroid.y:.4f}")
         print(f"  Floor plane centroid Z: {floor_centroid.z:.4f}")
         
-        # Get gearbox nodes
-        gearbox = extractor.get_gearbox_nodes()
+        # Gearbox nodes
         print(f"\n  Gearbox Nodes ({len(gearbox)}):")
-        for name, node in sorted(gearbox.items()):
-            print(f"    {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})")
+        _print_nodes(gearbox, sort=False)
         
         return cube
         
@@ -115,15 +149,18 @@ def test_target_extraction():
     
     parser = JBeamParser()
     combined_data = {}
+    sources = []
     
     for filepath in [engine_path, transmission_path]:
-        if not filepath.exists():
+        mtime_ns = file_mtime_ns(filepath)
+        if mtime_ns is None:
             print(f"ERROR: File not found: {filepath}")
             continue
         try:
-            data = JBeamParser.parse_jbeam(filepath)
+            data = cached_parse(str(filepath), mtime_ns)
             if data:
                 combined_data.update(data)
+                sources.append((str(filepath), mtime_ns))
                 print(f"✓ Parsed {filepath.name}")
             else:
                 print(f"✗ Failed to parse {filepath.name}")
@@ -134,22 +171,17 @@ def test_target_extraction():
         print("ERROR: No data loaded")
         return None, None
     
-    # Extract mount nodes
-    extractor = TargetVehicleExtractor(combined_data)
-    
-    mounts = extractor.extract_mounts()
+    # Extract mount nodes and reference engine cube
+    mounts, ref_cube = _extract_target(tuple(sources))
     print(f"\n✓ Extracted {len(mounts)} mount nodes:")
     for mount in mounts:
         print(f"    {mount.name} ({mount.mount_type}): ({mount.position.x:.4f}, {mount.position.y:.4f}, {mount.position.z:.4f})")
     
-    # Extract reference engine cube
-    ref_cube = extractor.extract_engine_cube()
     if ref_cube:
         print(f"\n✓ Extracted reference engine cube with {len(ref_cube.nodes)} nodes")
         
         print("\n  Engine Cube Nodes (BeamNG pattern):")
-        for name, node in sorted(ref_cube.nodes.items()):
-            print(f"    {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})")
+        _print_nodes(ref_cube.nodes, sort=False)
         
         print(f"\n  Centroid: {ref_cube.centroid}")
         
@@ -220,8 +252,7 @@ def test_solver():
     
     if result.engine_cube:
         print(f"\n  Translated Engine Cube ({result.engine_cube.source_pattern} naming):")
-        for name, node in sorted(result.engine_cube.nodes.items()):
-            print(f"    {name}: ({node.position.x:.4f}, {node.position.y:.4f}, {node.position.z:.4f})")
+        _print_nodes(result.engine_cube.nodes)
         
         # Generate jbeam output
         jbeam_nodes = result.to_jbeam_nodes()
@@ -317,51 +348,42 @@ def _mock_camso_nodes_normal():
 class TestGearboxIsExhaustPromotion(unittest.TestCase):
     """Test _promote_gearbox_isExhaust in DonorEngineExtractor."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Extraction is deterministic on the literal mocks and the tests only
+        # read the results, so each mock is extracted once for the class
+        cls.extractor = DonorEngineExtractor(_mock_camso_nodes_with_gearbox_exhaust())
+        cls.cube = cls.extractor.extract()
+        cls.beamng_cube = cls.cube.with_beamng_names()
+        cls.exhaust_nodes = cls.cube.get_exhaust_nodes()
+        cls.normal_cube = DonorEngineExtractor(_mock_camso_nodes_normal()).extract()
+
     def test_promotes_dual_gearbox_isExhaust(self):
         """c9a0e pattern: 2 gearbox nodes carry isExhaust → promoted to cube."""
-        data = _mock_camso_nodes_with_gearbox_exhaust()
-        extractor = DonorEngineExtractor(data)
-        cube = extractor.extract()
-
         # After extraction, the cube nodes should carry isExhaust
-        exhaust_nodes = {
-            name: node for name, node in cube.nodes.items()
-            if node.node_properties.get("isExhaust")
-        }
-        self.assertEqual(len(exhaust_nodes), 2, f"Expected 2 isExhaust, got: {list(exhaust_nodes)}")
+        exhaust_names = [n.name for n in self.exhaust_nodes]
+        self.assertEqual(len(exhaust_names), 2, f"Expected 2 isExhaust, got: {exhaust_names}")
 
     def test_promotes_to_floor_plane_only(self):
         """isExhaust should land on bottom-plane nodes (same Z as gearbox)."""
-        data = _mock_camso_nodes_with_gearbox_exhaust()
-        extractor = DonorEngineExtractor(data)
-        cube = extractor.extract()
-
-        for name, node in cube.nodes.items():
-            if node.node_properties.get("isExhaust"):
-                self.assertAlmostEqual(
-                    node.position.z, 0.384707, places=3,
-                    msg=f"isExhaust node {name} not on floor plane (z={node.position.z})",
-                )
+        for node in self.exhaust_nodes:
+            self.assertAlmostEqual(
+                node.position.z, 0.384707, places=3,
+                msg=f"isExhaust node {node.name} not on floor plane (z={node.position.z})",
+            )
 
     def test_avoids_intake_nodes(self):
         """isExhaust must not land on nodes with engine_intake in engineGroup."""
-        data = _mock_camso_nodes_with_gearbox_exhaust()
-        extractor = DonorEngineExtractor(data)
-        cube = extractor.extract()
-
-        for name, node in cube.nodes.items():
-            if node.node_properties.get("isExhaust"):
-                engine_group = node.node_properties.get("engineGroup", [])
-                self.assertNotIn(
-                    "engine_intake", engine_group,
-                    f"isExhaust promoted to intake node {name}",
-                )
+        for node in self.exhaust_nodes:
+            engine_group = node.node_properties.get("engineGroup", [])
+            self.assertNotIn(
+                "engine_intake", engine_group,
+                f"isExhaust promoted to intake node {node.name}",
+            )
 
     def test_correct_target_nodes_c9a0e(self):
         """For c9a0e geometry, Gearbox8→engine3, Gearbox9→engine2 (nearest)."""
-        data = _mock_camso_nodes_with_gearbox_exhaust()
-        extractor = DonorEngineExtractor(data)
-        cube = extractor.extract()
+        cube = self.cube
 
         # engine3 is at (-0.353, 1.390, 0.385) — nearest to Gearbox8 at (-0.177, 1.514, 0.385)
         # engine2 is at ( 0.353, 1.390, 0.385) — nearest to Gearbox9 at ( 0.177, 1.514, 0.385)
@@ -376,28 +398,18 @@ class TestGearboxIsExhaustPromotion(unittest.TestCase):
 
     def test_no_op_when_cube_has_isExhaust(self):
         """Normal engines with isExhaust already on cube nodes — no changes."""
-        data = _mock_camso_nodes_normal()
-        extractor = DonorEngineExtractor(data)
-        cube = extractor.extract()
+        cube = self.normal_cube
 
         # engine2 should still have isExhaust
         self.assertEqual(
             cube.nodes["engine2"].node_properties.get("isExhaust"), "mainEngine",
         )
         # Only 1 isExhaust total
-        count = sum(
-            1 for n in cube.nodes.values()
-            if n.node_properties.get("isExhaust")
-        )
-        self.assertEqual(count, 1)
+        self.assertEqual(len(cube.get_exhaust_nodes()), 1)
 
     def test_gearbox_nodes_stripped_of_isExhaust_after_promotion(self):
         """After promotion, gearbox nodes should no longer carry isExhaust."""
-        data = _mock_camso_nodes_with_gearbox_exhaust()
-        extractor = DonorEngineExtractor(data)
-        extractor.extract()
-
-        for node in extractor.get_gearbox_nodes().values():
+        for node in self.extractor.get_gearbox_nodes().values():
             self.assertIsNone(
                 node.node_properties.get("isExhaust"),
                 f"Gearbox node {node.name} still has isExhaust after promotion",
@@ -405,15 +417,7 @@ class TestGearboxIsExhaustPromotion(unittest.TestCase):
 
     def test_beamng_names_preserve_promoted_isExhaust(self):
         """After with_beamng_names(), promoted isExhaust survives on eNx nodes."""
-        data = _mock_camso_nodes_with_gearbox_exhaust()
-        extractor = DonorEngineExtractor(data)
-        cube = extractor.extract()
-        beamng_cube = cube.with_beamng_names()
-
-        exhaust_nodes = {
-            name: node for name, node in beamng_cube.nodes.items()
-            if node.node_properties.get("isExhaust")
-        }
+        exhaust_nodes = {n.name for n in self.beamng_cube.get_exhaust_nodes()}
         self.assertEqual(len(exhaust_nodes), 2)
         # engine2→e1l, engine3→e1r (the map in EngineCube)
         self.assertIn("e1l", exhaust_nodes, "engine2 → e1l should carry isExhaust")
@@ -437,15 +441,12 @@ class TestGearboxIsExhaustPromotionRealData(unittest.TestCase):
 
     def test_c9a0e_dual_gearbox_exhaust(self):
         """Real c9a0e engine: Gearbox8/9 carry isExhaust → promoted to cube."""
-        data = JBeamParser.parse_jbeam(REAL_C9A0E)
+        data = cached_parse(str(REAL_C9A0E), REAL_C9A0E.stat().st_mtime_ns)
         self.assertIsNotNone(data)
         extractor = DonorEngineExtractor(data)
         cube = extractor.extract()
 
-        exhaust_nodes = [
-            name for name, node in cube.nodes.items()
-            if node.node_properties.get("isExhaust")
-        ]
+        exhaust_nodes = [n.name for n in cube.get_exhaust_nodes()]
         self.assertEqual(len(exhaust_nodes), 2, f"Expected 2 isExhaust on cube, got: {exhaust_nodes}")
         # Both should be floor-plane nodes
         for name in exhaust_nodes:
@@ -454,15 +455,12 @@ class TestGearboxIsExhaustPromotionRealData(unittest.TestCase):
     @unittest.skipUnless(REAL_036A5_CAMSONAV6.exists(), "036a5 camsonav6 file not available")
     def test_036a5_dual_gearbox_exhaust(self):
         """Real camsonav6/036a5 engine: same pattern as c9a0e."""
-        data = JBeamParser.parse_jbeam(REAL_036A5_CAMSONAV6)
+        data = cached_parse(str(REAL_036A5_CAMSONAV6), REAL_036A5_CAMSONAV6.stat().st_mtime_ns)
         self.assertIsNotNone(data)
         extractor = DonorEngineExtractor(data)
         cube = extractor.extract()
 
-        exhaust_nodes = [
-            name for name, node in cube.nodes.items()
-            if node.node_properties.get("isExhaust")
-        ]
+        exhaust_nodes = [n.name for n in cube.get_exhaust_nodes()]
         self.assertEqual(len(exhaust_nodes), 2, f"Expected 2 isExhaust on cube, got: {exhaust_nodes}")
 
 
@@ -2,49 +2,82 @@
 """Phase 2 validation: Test Camso donor drive type classification against all 10 exports."""
 
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # Add scripts dir to path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from engineswap import EngineTransplantUtility
 
-# Expected results for each export
-EXPECTED = {
-    "script_test_rwd":            ("RWD", None),
-    "mid_longitudinal_rearwd":    ("RWD", None),
-    "tranv_mr":                   ("RWD", None),
-    "testy623":                   ("FWD", None),
-    "jerp_chadiator_lockers":     ("4WD", None),
-    "ondemandawd":                ("AWD", "on_demand"),
-    "viscousawd_clutched":        ("AWD", "viscous"),
-    "testcvt":                    ("AWD", "helical"),
-    "tranv_mr_awd_dct":           ("AWD", "helical"),
-    "advancedawd_electricdiffs":  ("AWD", "advanced"),
-}
-
-# Engine file paths (pattern: mods/unpacked/<export>/vehicles/<vehicle>/eng_<hash>/camso_engine_<hash>.jbeam)
-ENGINE_PATHS = {
-    "script_test_rwd":            "mods/unpacked/script_test_rwd/vehicles/test_rwd/eng_9a706/camso_engine_9a706.jbeam",
-    "mid_longitudinal_rearwd":    "mods/unpacked/mid_longitudinal_rearwd/vehicles/test_mr/eng_ec3fa/camso_engine_ec3fa.jbeam",
-    "tranv_mr":                   "mods/unpacked/tranv_mr/vehicles/test_mr_tranv/eng_7486c/camso_engine_7486c.jbeam",
-    "testy623":                   "mods/unpacked/testy623/vehicles/test_623/eng_28457/camso_engine_28457.jbeam",
-    "jerp_chadiator_lockers":     "mods/unpacked/jerp_chadiator_lockers/vehicles/jerp_chadiator/eng_34607/camso_engine_34607.jbeam",
-    "ondemandawd":                "mods/unpacked/ondemandawd/vehicles/ondemandawd_helicaldiffs/eng_34607/camso_engine_34607.jbeam",
-    "viscousawd_clutched":        "mods/unpacked/viscousawd_clutched/vehicles/viscousawd_clutched/eng_34607/camso_engine_34607.jbeam",
-    "testcvt":                    "mods/unpacked/testcvt/vehicles/helicalawd/eng_3813e/camso_engine_3813e.jbeam",
-    "tranv_mr_awd_dct":           "mods/unpacked/tranv_mr_awd_dct/vehicles/test_mr_tranv_awd_dct/eng_7486c/camso_engine_7486c.jbeam",
-    "advancedawd_electricdiffs":  "mods/unpacked/advancedawd_electricdiffs/vehicles/advancedawd_electricdiffs/eng_34607/camso_engine_34607.jbeam",
-}
+# (export, expected drive type, expected AWD sub-variant, engine file) per export.
+# Engine file pattern: mods/unpacked/<export>/vehicles/<vehicle>/eng_<hash>/camso_engine_<hash>.jbeam
+CASES: List[Tuple[str, str, Optional[str], str]] = [
+    ("script_test_rwd",           "RWD", None,        "mods/unpacked/script_test_rwd/vehicles/test_rwd/eng_9a706/camso_engine_9a706.jbeam"),
+    ("mid_longitudinal_rearwd",   "RWD", None,        "mods/unpacked/mid_longitudinal_rearwd/vehicles/test_mr/eng_ec3fa/camso_engine_ec3fa.jbeam"),
+    ("tranv_mr",                  "RWD", None,        "mods/unpacked/tranv_mr/vehicles/test_mr_tranv/eng_7486c/camso_engine_7486c.jbeam"),
+    ("testy623",                  "FWD", None,        "mods/unpacked/testy623/vehicles/test_623/eng_28457/camso_engine_28457.jbeam"),
+    ("jerp_chadiator_lockers",    "4WD", None,        "mods/unpacked/jerp_chadiator_lockers/vehicles/jerp_chadiator/eng_34607/camso_engine_34607.jbeam"),
+    ("ondemandawd",               "AWD", "on_demand", "mods/unpacked/ondemandawd/vehicles/ondemandawd_helicaldiffs/eng_34607/camso_engine_34607.jbeam"),
+    ("viscousawd_clutched",       "AWD", "viscous",   "mods/unpacked/viscousawd_clutched/vehicles/viscousawd_clutched/eng_34607/camso_engine_34607.jbeam"),
+    ("testcvt",                   "AWD", "helical",   "mods/unpacked/testcvt/vehicles/helicalawd/eng_3813e/camso_engine_3813e.jbeam"),
+    ("tranv_mr_awd_dct",          "AWD", "helical",   "mods/unpacked/tranv_mr_awd_dct/vehicles/test_mr_tranv_awd_dct/eng_7486c/camso_engine_7486c.jbeam"),
+    ("advancedawd_electricdiffs", "AWD", "advanced",  "mods/unpacked/advancedawd_electricdiffs/vehicles/advancedawd_electricdiffs/eng_34607/camso_engine_34607.jbeam"),
+]
 
+BASE = Path(__file__).resolve().parent.parent
 
-def main():
-    base = Path(__file__).resolve().parent.parent
-    
-    # Minimal utility init
+
+def _make_utility() -> EngineTransplantUtility:
+    """Minimal utility init (no config/CLI setup needed for donor analysis)."""
     utility = EngineTransplantUtility.__new__(EngineTransplantUtility)
-    utility.base_vehicles_path = base / "SteamLibrary_content_vehicles"
-    utility.donor_mods_path = base / "mods" / "unpacked"
+    utility.base_vehicles_path = BASE / "SteamLibrary_content_vehicles"
+    utility.donor_mods_path = BASE / "mods" / "unpacked"
+    return utility
+
+
+def _analyze_case(engine_rel: str, utility: Optional[EngineTransplantUtility] = None):
+    """Return (drive_type, awd_subvariant) for one export, or None if its engine file is missing.
+
+    Module-level so --parallel can ship it to worker processes, each of which
+    builds its own utility.
+    """
+    engine_path = BASE / engine_rel
+    if not engine_path.exists():
+        return None
+
+    result = (utility or _make_utility()).analyze_donor_powertrain(engine_path)
+    if result is None:
+        return "NONE", None
+    return result["drive_type"], result.get("awd_subvariant")
+
+
+def _untracked_engine_files() -> List[str]:
+    """BASE-relative Camso donor engines on disk that CASES does not cover.
+
+    Globs every mod export, so it only runs when asked (--list-untracked).
+    """
+    tracked = {rel for *_, rel in CASES}
+    donors = BASE / "mods" / "unpacked"
+    return sorted(
+        rel for rel in (
+            p.relative_to(BASE).as_posix()
+            for p in donors.glob("*/vehicles/*/eng_*/camso_engine_*.jbeam")
+        )
+        if rel not in tracked
+    )
+
+
+def main():
+    # --parallel fans the independent exports out over worker processes;
+    # results are still reported in CASES order
+    if "--parallel" in sys.argv[1:]:
+        with ProcessPoolExecutor() as pool:
+            outcomes = list(pool.map(_analyze_case, [rel for *_, rel in CASES]))
+    else:
+        utility = _make_utility()
+        outcomes = (_analyze_case(rel, utility) for *_, rel in CASES)
     
     passed = 0
     failed = 0
@@ -54,23 +87,13 @@ def main():
     print("Phase 2 Validation: Camso Donor Drive Type Classification")
     print("=" * 70)
     
-    for export_name, (expected_type, expected_sub) in EXPECTED.items():
-        engine_rel = ENGINE_PATHS[export_name]
-        engine_path = base / engine_rel
-        
-        if not engine_path.exists():
+    for (export_name, expected_type, expected_sub, engine_rel), outcome in zip(CASES, outcomes):
+        if outcome is None:
             print(f"  SKIP  {export_name}: engine file not found ({engine_rel})")
             errors.append((export_name, "FILE_NOT_FOUND"))
             continue
         
-        result = utility.analyze_donor_powertrain(engine_path)
-        
-        if result is None:
-            actual_type = "NONE"
-            actual_sub = None
-        else:
-            actual_type = result["drive_type"]
-            actual_sub = result.get("awd_subvariant")
+        actual_type, actual_sub = outcome
         
         type_ok = actual_type == expected_type
         sub_ok = actual_sub == expected_sub
@@ -89,7 +112,15 @@ def main():
               f"  (expected: {expected_type}{exp_sub_str})")
     
     print("=" * 70)
-    print(f"Results: {passed} passed, {failed} failed out of {len(EXPECTED)}")
+    print(f"Results: {passed} passed, {failed} failed out of {len(CASES)}")
+    
+    # --list-untracked surfaces new exports and engine hash drift
+    if "--list-untracked" in sys.argv[1:]:
+        untracked = _untracked_engine_files()
+        if untracked:
+            print("\nDonor engines on disk not covered by CASES:")
+            for rel in untracked:
+                print(f"  - {rel}")
     
     if errors:
         print("\nFailures:")
@@ -9,16 +9,42 @@ Tests cover:
 
 Each test case supplies pre-computed donor_catalog and tc_catalog, then verifies
 strategy, cost, refused flag, and mode from the decision dict.
+
+Target TC catalogs are persisted under ~/.cache/autobeamswapper, keyed on the
+mtimes of the vehicle's jbeams and the analyzer sources; pass --no-cache to
+always recompute them.
 """
 
+import hashlib
+import os
+import pickle
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
 
+from analyze_powertrains import get_search_folders
 from engineswap import EngineTransplantUtility
 
-BASE = Path(__file__).resolve().parent.parent
+BASE = SCRIPTS_DIR.parent
+TC_CACHE_DIR = Path.home() / ".cache" / "autobeamswapper"
+
+# Sources whose logic shapes analyze_target_powertrain() output (engineswap
+# and the repo modules it imports); editing them invalidates persisted
+# catalogs just like editing the vehicle jbeams does
+_ANALYZER_SOURCES = tuple(
+    SCRIPTS_DIR / f"{name}.py"
+    for name in (
+        "engineswap", "analyze_powertrains", "mount_solver", "slot_graph",
+        "exhaust_solver", "powertrain_tweaks", "mod_packager",
+    )
+)
 
 # =============================================================================
 # Donor catalog stubs (matching analyze_donor_powertrain output format)
@@ -153,20 +179,95 @@ TEST_CASES = [
 ]
 
 
+@dataclass(frozen=True, slots=True)
+class Case:
+    """One TEST_CASES row with its swap config merged over the auto default."""
+    name: str
+    donor: Dict[str, Any]
+    vehicle: str
+    swap_config: Mapping[str, Any]
+    expected: Tuple[str, int, bool, str]
+
+
+_AUTO_SWAP_CONFIG = MappingProxyType({"transfercase_to_adapt": "auto"})
+
+# Configs are merged and frozen once at import; each case's read-only mapping
+# is assigned to the utility directly, so no case can leak into another
+CASES = tuple(
+    Case(
+        name, donor, vehicle,
+        MappingProxyType({**_AUTO_SWAP_CONFIG, **override}) if override else _AUTO_SWAP_CONFIG,
+        expected,
+    )
+    for name, donor, vehicle, override, expected in TEST_CASES
+)
+
+
+def _tc_catalog_key(utility, vehicle):
+    """Digest of (path, mtime_ns) for every input the vehicle's TC catalog depends on."""
+    digest = hashlib.sha1()
+    inputs = list(_ANALYZER_SOURCES)
+    for folder in sorted(get_search_folders(utility.base_vehicles_path, vehicle)):
+        inputs.extend(sorted(folder.rglob("*.jbeam")))
+    for path in inputs:
+        digest.update(f"{path}\0{path.stat().st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:12]
+
+
+def load_tc_catalog(utility, vehicle, use_cache=True):
+    """analyze_target_powertrain(vehicle), persisted across runs when use_cache."""
+    if not use_cache:
+        return utility.analyze_target_powertrain(vehicle)
+
+    prefix = f"tc_catalog_{vehicle}"
+    cache_path = TC_CACHE_DIR / f"{prefix}_{_tc_catalog_key(utility, vehicle)}.pkl"
+    try:
+        with cache_path.open("rb") as fh:
+            return pickle.load(fh)
+    except Exception:
+        # Missing, truncated or stale (classes changed) — recompute
+        pass
+
+    catalog = utility.analyze_target_powertrain(vehicle)
+    # Failed analyses (None) are not persisted so they are retried next run
+    if catalog is not None:
+        TC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so an interrupted run never
+        # leaves a partial pickle under the final name
+        fd, tmp_name = tempfile.mkstemp(dir=TC_CACHE_DIR, prefix=f".{prefix}_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                pickle.dump(catalog, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        # Drop catalogs of this vehicle keyed on older inputs
+        for old in TC_CACHE_DIR.glob(f"{prefix}_*.pkl"):
+            if old != cache_path and old.stem.rsplit("_", 1)[0] == prefix:
+                old.unlink(missing_ok=True)
+    return catalog
+
+
 def main():
+    use_cache = "--no-cache" not in sys.argv[1:]
+
     # Build utility with default auto config
     utility = EngineTransplantUtility.__new__(EngineTransplantUtility)
     utility.base_vehicles_path = BASE / "SteamLibrary_content_vehicles"
     utility.donor_mods_path = BASE / "mods" / "unpacked"
-    utility._swap_config = {"transfercase_to_adapt": "auto"}
+    utility._swap_config = _AUTO_SWAP_CONFIG
     utility._last_donor_drive_type = None
 
     # Pre-compute TC catalogs for target vehicles (expensive — do once)
+    # The vehicles are independent and analyze_target_powertrain() keeps no
+    # state on the utility, so they are analyzed concurrently
     print("Pre-computing target vehicle TC catalogs...")
-    tc_cache = {}
-    vehicles_needed = sorted(set(t[2] for t in TEST_CASES))
+    vehicles_needed = sorted({case.vehicle for case in CASES})
+    with ThreadPoolExecutor(max_workers=min(8, len(vehicles_needed))) as pool:
+        catalogs = pool.map(lambda v: load_tc_catalog(utility, v, use_cache), vehicles_needed)
+        tc_cache = dict(zip(vehicles_needed, catalogs))
     for v in vehicles_needed:
-        tc_cache[v] = utility.analyze_target_powertrain(v)
         tc_count = len(tc_cache[v]["transfer_cases"]) if tc_cache[v] else 0
         print(f"  {v}: {tc_count} TC variants")
 
@@ -179,14 +280,15 @@ def main():
     failed = 0
     errors = []
 
-    for name, donor, vehicle, config_override, (exp_strat, exp_cost, exp_refused, exp_mode) in TEST_CASES:
-        # Apply config override (or reset to auto)
-        utility._swap_config = {"transfercase_to_adapt": "auto"}
-        utility._swap_config.update(config_override)
+    for case in CASES:
+        name = case.name
+        exp_strat, exp_cost, exp_refused, exp_mode = case.expected
+        # Apply the pre-merged config (auto default plus any override)
+        utility._swap_config = case.swap_config
 
-        tc_catalog = tc_cache[vehicle]
+        tc_catalog = tc_cache[case.vehicle]
         try:
-            decision = utility.select_swap_strategy(donor, tc_catalog, vehicle)
+            decision = utility.select_swap_strategy(case.donor, tc_catalog, case.vehicle)
         except Exception as e:
             print(f"  ERROR {name}: {e}")
             errors.append((name, str(e)))
@@ -222,7 +324,7 @@ def main():
     print()
     print("-" * 72)
     print(f"Results: {passed} passed, {failed} failed, "
-          f"{len(errors)} errors out of {len(TEST_CASES)} tests")
+          f"{len(errors)} errors out of {len(CASES)} tests")
 
     if errors:
         print("\nFailures:")